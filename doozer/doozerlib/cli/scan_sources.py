@@ -1,7 +1,9 @@
 import asyncio
 import json
+import logging
+import subprocess
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import artcommonlib.util
 import click
@@ -38,10 +40,14 @@ class ConfigScanSources:
         self.assessment_reason = dict()  # maps metadata qualified_key => message describing change
         self.issues = list()  # tracks issues that arose during the scan, which did not interrupt the job
 
+        # Keep the runtime ordering of image metas around, so that it does not need to be rebuilt for each check
+        self._image_metas: Tuple[ImageMetadata, ...] = tuple(runtime.image_metas())
         self.all_rpm_metas = set(runtime.rpm_metas())
-        self.all_image_metas = set(runtime.image_metas())
+        self.all_image_metas = set(self._image_metas)
         self.all_metas = self.all_rpm_metas.union(self.all_image_metas)
 
+        self._descendants_cache: Dict[str, Set[ImageMetadata]] = {}  # maps distgit_key => descendant metas
+        self._istag_lookup = rhcos.CIClusterIstagLookup(ci_kubeconfig)
         self.oldest_image_event_ts = None
         self.newest_image_event_ts = 0
 
@@ -197,24 +203,28 @@ class ConfigScanSources:
             return True
         raise IOError(f'Could not determine ancestry between public and private upstreams for {repo_name}')
 
+    @staticmethod
+    def _has_sha_branch(metadata: Metadata) -> bool:
+        """
+        Return True if the upstream source of a component is pinned to a commit hash rather than a branch
+        """
+
+        try:
+            int(metadata.config.content.source.git.branch.target, 16)
+            return True
+        except (TypeError, ValueError):
+            # target branch is a normal branch name
+            return False
+
     def rebase_into_priv(self):
         if self.dry_run:
             self.runtime.logger.info('Would have rebased into openshift-priv')
             return
 
         self.runtime.logger.info('Rebasing public upstream contents into openshift-priv')
-        upstream_mappings = exectools.parallel_exec(
-            lambda meta, _: (
-                meta,
-                SourceResolver.get_public_upstream(
-                    meta.config.content.source.git.url, self.runtime.group_config.public_upstreams
-                ),
-            ),
-            self.all_metas,
-            n_threads=20,
-        ).get()
+        public_upstreams = self.runtime.group_config.public_upstreams
 
-        for metadata, public_upstream in upstream_mappings:
+        for metadata in self.all_metas:
             # Skip rebase for disabled images
             if not metadata.enabled:
                 self.runtime.logger.warning('%s is disabled: skipping rebase', metadata.name)
@@ -228,7 +238,15 @@ class ConfigScanSources:
                 )
                 continue
 
-            public_url, public_branch_name, has_public_upstream = public_upstream
+            # If a git commit hash was declared as the upstream source, skip the rebase before resolving any URL
+            if self._has_sha_branch(metadata):
+                self.runtime.logger.warning('Target branch for %s is a SHA: skipping rebase', metadata.name)
+                continue
+
+            # Public upstream mapping is plain string manipulation: no need for a thread pool
+            public_url, public_branch_name, has_public_upstream = SourceResolver.get_public_upstream(
+                metadata.config.content.source.git.url, public_upstreams
+            )
 
             # If no public upstream exists, skip the rebase
             if not has_public_upstream:
@@ -242,17 +260,6 @@ class ConfigScanSources:
             priv_url = artcommonlib.util.convert_remote_git_to_https(metadata.config.content.source.git.url)
             priv_branch_name = metadata.config.content.source.git.branch.target
 
-            # If a git commit hash was declared as the upstream source, skip the rebase
-            try:
-                _ = int(priv_branch_name, 16)
-                # target branch is a sha: skip rebase for this component
-                self.runtime.logger.warning('Target branch for %s is a SHA: skipping rebase', metadata.name)
-                continue
-
-            except ValueError:
-                # target branch is a normal branch name
-                pass
-
             # If no public_upstreams field exists, public_branch_name will be None
             public_branch_name = public_branch_name or priv_branch_name
 
@@ -351,30 +358,54 @@ class ConfigScanSources:
                 raise IOError(f'Unsupported meta type: {meta.meta_type}')
 
     async def check_for_image_changes(self, koji_api):
-        async def _inner(image_meta):
+        # Latest builds are needed both for the images themselves and to compare them with their dependents:
+        # fetch them all at once, along with their rebase times
+        image_metas = self._image_metas
+        build_infos = await asyncio.gather(
+            *[image_meta.get_latest_build(default=None, exclude_large_columns=True) for image_meta in image_metas]
+        )
+        latest_builds = {
+            image_meta.distgit_key: build_info for image_meta, build_info in zip(image_metas, build_infos) if build_info
+        }
+        rebase_times = {}
+        for dgk, build_info in latest_builds.items():
+            rebase_time = release_util.isolate_timestamp_in_release(build_info["release"])
+            if rebase_time:  # no timestamp string in NVR?
+                rebase_times[dgk] = datetime.strptime(rebase_time, "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
+
+        # Bind hot lookups once rather than resolving them for every image and dependency
+        image_map = self.runtime.image_map
+        changing_image_metas = self.changing_image_metas
+
+        assessed_builds = []
+        config_changed_metas = []
+        for image_meta in image_metas:
             # If a rebuild is already requested, skip following checks
-            if image_meta in self.changing_image_metas:
-                return
-
-            build_info = await image_meta.get_latest_build(default=None, exclude_large_columns=True)
+            if image_meta in changing_image_metas:
+                continue
 
+            build_info = latest_builds.get(image_meta.distgit_key)
             if build_info is None:
-                return
+                continue
 
-            # To limit the size of the queries we are going to make, find the oldest and newest image
-            self.find_oldest_newest(koji_api, build_info)
+            assessed_builds.append(build_info)
 
             # Request a rebuild if A is a dependent (operator or child image) of B
             # but the latest build of A is older than B.
-            self.check_dependents(image_meta, build_info)
+            self.check_dependents(image_meta, rebase_times, image_map)
 
             # If no upstream change has been detected, check configurations
             # like image meta, repos, and streams to see if they have changed
             # We detect config changes by comparing their digest changes.
             # The config digest of the previous build is stored at .oit/config_digest on distgit repo.
-            self.check_config_changes(image_meta, build_info)
+            if self.check_config_changes(image_meta, build_info):
+                config_changed_metas.append(image_meta)
+
+        # Commit messages of all changed configs are looked up at once
+        self.check_config_commits(config_changed_metas)
 
-        await asyncio.gather(*[_inner(image_meta) for image_meta in self.runtime.image_metas()])
+        # To limit the size of the queries we are going to make, find the oldest and newest image
+        self.find_oldest_newest(koji_api, assessed_builds)
 
         self.runtime.logger.debug(
             'Will be assessing tagging changes between newest_image_event_ts:%s and oldest_image_event_ts:%s',
@@ -382,19 +413,32 @@ class ConfigScanSources:
             self.oldest_image_event_ts,
         )
 
-    def find_oldest_newest(self, koji_api, build_info):
-        create_event_ts = koji_api.getEvent(build_info['creation_event_id'])['ts']
-        if self.oldest_image_event_ts is None or create_event_ts < self.oldest_image_event_ts:
-            self.oldest_image_event_ts = create_event_ts
-        if create_event_ts > self.newest_image_event_ts:
-            self.newest_image_event_ts = create_event_ts
+    def find_oldest_newest(self, koji_api, build_infos: List[Dict]):
+        if not build_infos:
+            return
+
+        # Fetch all creation events in a single round trip
+        with koji_api.multicall(strict=True) as m:
+            event_tasks = [m.getEvent(build_info['creation_event_id']) for build_info in build_infos]
+        create_event_timestamps = [task.result['ts'] for task in event_tasks]
+
+        oldest_ts = min(create_event_timestamps)
+        if self.oldest_image_event_ts is None or oldest_ts < self.oldest_image_event_ts:
+            self.oldest_image_event_ts = oldest_ts
+        self.newest_image_event_ts = max(self.newest_image_event_ts, *create_event_timestamps)
 
-    def check_dependents(self, image_meta: ImageMetadata, build_info):
-        rebase_time = release_util.isolate_timestamp_in_release(build_info["release"])
+    def check_dependents(
+        self, image_meta: ImageMetadata, rebase_times: Dict[str, datetime], image_map: Dict[str, ImageMetadata]
+    ):
+        """
+        :param image_meta: The image to check
+        :param rebase_times: Maps distgit keys to the rebase time of their latest build
+        :param image_map: Maps distgit keys to the image metas loaded by the runtime
+        """
+        rebase_time = rebase_times.get(image_meta.distgit_key)
         if not rebase_time:  # no timestamp string in NVR?
             return
 
-        rebase_time = datetime.strptime(rebase_time, "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
         dependencies = image_meta.dependencies.copy()
         base_image = image_meta.config["from"].member
 
@@ -405,35 +449,23 @@ class ConfigScanSources:
             if builder.member:
                 dependencies.add(builder.member)
 
-        def _check_dep(dep_key):
-            dep = self.runtime.image_map.get(dep_key)
-            if not dep:
+        for dep_key in dependencies:
+            if dep_key not in image_map:
                 self.runtime.logger.warning(
                     "Image %s has unknown dependency %s. Is it excluded?", image_meta.distgit_key, dep_key
                 )
-                return
-
-            dep_info = dep.get_latest_brew_build(default=None)
-            if not dep_info:
-                return
-
-            dep_rebase_time = release_util.isolate_timestamp_in_release(dep_info["release"])
-            if not dep_rebase_time:  # no timestamp string in NVR?
-                return
+                continue
 
-            dep_rebase_time = datetime.strptime(dep_rebase_time, "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
-            if dep_rebase_time > rebase_time:
+            dep_rebase_time = rebase_times.get(dep_key)
+            if dep_rebase_time and dep_rebase_time > rebase_time:
                 self.add_image_meta_change(
                     image_meta, RebuildHint(RebuildHintCode.DEPENDENCY_NEWER, 'Dependency has a newer build')
                 )
 
-        exectools.parallel_exec(
-            f=lambda dep, _: _check_dep(dep),
-            args=dependencies,
-            n_threads=20,
-        )
-
-    def check_config_changes(self, image_meta: ImageMetadata, build_info):
+    def check_config_changes(self, image_meta: ImageMetadata, build_info) -> bool:
+        """
+        :return: True if the config digest of the image differs from the one of its latest build
+        """
         try:
             # git://pkgs.devel.redhat.com/containers/atomic-openshift-descheduler#6fc9c31e5d9437ac19e3c4b45231be8392cdacac
             source_url = build_info['source']
@@ -446,19 +478,7 @@ class ConfigScanSources:
                 self.runtime.logger.info(
                     '%s config_digest %s is differing from %s', image_meta.distgit_key, prev_digest, current_digest
                 )
-                # fetch latest commit message on branch for the image metadata file
-                with Dir(self.runtime.data_dir):
-                    path = f'images/{image_meta.config_filename}'
-                    rc, commit_message, _ = exectools.cmd_gather(f'git log -1 --format=%s -- {path}', strip=True)
-                    if rc != 0:
-                        raise IOError(f'Unable to retrieve commit message from {self.runtime.data_dir} for {path}')
-
-                if 'scan-sources:noop' in commit_message.lower():
-                    self.runtime.logger.info('Ignoring digest change since commit message indicates noop')
-                else:
-                    self.add_image_meta_change(
-                        image_meta, RebuildHint(RebuildHintCode.CONFIG_CHANGE, 'Metadata configuration change')
-                    )
+                return True
         except exectools.RetryException:
             self.runtime.logger.info('%s config_digest cannot be retrieved; request a build', image_meta.distgit_key)
             self.add_image_meta_change(
@@ -468,27 +488,93 @@ class ConfigScanSources:
         except IOError:
             # IOError is raised by fetch_cgit_file() when config_digest could not be found
             self.runtime.logger.warning('config_digest not found for %s: skipping config check', image_meta.name)
+
+        return False
+
+    def check_config_commits(self, image_metas: List[ImageMetadata]):
+        """
+        Request a rebuild of images whose config digest changed,
+        unless the last commit to their metadata file is flagged with scan-sources:noop
+        """
+
+        if not image_metas:
+            return
+
+        # fetch latest commit message on branch for the image metadata files
+        paths = {image_meta: f'images/{image_meta.config_filename}' for image_meta in image_metas}
+        try:
+            commit_subjects = self._get_last_commit_subjects(list(paths.values()))
+        except IOError as e:
+            self.runtime.logger.warning('%s: skipping config check', e)
             return
 
+        for image_meta, path in paths.items():
+            if 'scan-sources:noop' in commit_subjects.get(path, '').lower():
+                self.runtime.logger.info(
+                    'Ignoring %s digest change since commit message indicates noop', image_meta.distgit_key
+                )
+            else:
+                self.add_image_meta_change(
+                    image_meta, RebuildHint(RebuildHintCode.CONFIG_CHANGE, 'Metadata configuration change')
+                )
+
+    def _get_last_commit_subjects(self, paths: List[str]) -> Dict[str, str]:
+        """
+        Map image metadata file paths to the subject of the last commit that touched them.
+        A single git log is run over the requested paths, and stops as soon as each of them has been seen.
+        """
+
+        wanted = set(paths)
+        subjects = {}
+        with subprocess.Popen(
+            ['git', 'log', '--format=%x00%s', '--name-only', '--relative', '--', *wanted],
+            cwd=self.runtime.data_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        ) as proc:
+            # Each commit is printed as NUL and its subject, then the paths it changed: newest commits come first
+            subject = ''
+            for line in proc.stdout:
+                line = line.rstrip('\n')
+                if line.startswith('\0'):
+                    subject = line[1:]
+                elif line in wanted:
+                    subjects.setdefault(line, subject)
+                    if len(subjects) == len(wanted):
+                        # Older commits cannot change the result
+                        proc.terminate()
+                        return subjects
+
+        if proc.returncode != 0:
+            raise IOError(f'Unable to retrieve commit messages from {self.runtime.data_dir}')
+        return subjects
+
     async def check_changing_rpms(self):
         # Checks if an image needs to be rebuilt based on the packages (and therefore RPMs)
         # it is dependent on might have changed in tags relevant to the image.
         # A check is also made if the image depends on a package we know is changing
         # because we are about to rebuild it.
 
+        # Each check issues several brew queries: bound how many images are assessed at once
+        semaphore = asyncio.Semaphore(16)
+
         async def _thread_does_image_need_change(image_meta):
-            return await image_meta.does_image_need_change(
-                changing_rpm_packages=self.changing_rpm_packages,
-                buildroot_tag=image_meta.build_root_tag(),
-                newest_image_event_ts=self.newest_image_event_ts,
-                oldest_image_event_ts=self.oldest_image_event_ts,
-            )
+            async with semaphore:
+                return await image_meta.does_image_need_change(
+                    changing_rpm_packages=self.changing_rpm_packages,
+                    buildroot_tag=image_meta.build_root_tag(),
+                    newest_image_event_ts=self.newest_image_event_ts,
+                    oldest_image_event_ts=self.oldest_image_event_ts,
+                )
 
         change_results = await asyncio.gather(
-            *[_thread_does_image_need_change(image_meta) for image_meta in self.runtime.image_metas()],
+            *[_thread_does_image_need_change(image_meta) for image_meta in self._image_metas]
         )
-
-        for change_result in filter(lambda r: r, change_results):
+        # Apply the results in image order, so that the reasons reported do not depend on query timing
+        for change_result in change_results:
+            if not change_result:
+                continue
             meta, rebuild_hint = change_result
             if rebuild_hint.rebuild:
                 self.add_image_meta_change(meta, rebuild_hint)
@@ -499,7 +585,7 @@ class ConfigScanSources:
         # fyi, changes in direct parent images should be detected by RPM changes, which
         # does does_image_name_change will detect.
         while True:
-            changing_image_dgks = [meta.distgit_key for meta in self.changing_image_metas]
+            changing_image_dgks = {meta.distgit_key for meta in self.changing_image_metas}
             for image_meta in self.all_image_metas:
                 dgk = image_meta.distgit_key
                 if dgk in changing_image_dgks:  # Already in? Don't look any further
@@ -521,16 +607,30 @@ class ConfigScanSources:
 
     def add_assessment_reason(self, meta, rebuild_hint: RebuildHint):
         # qualify by whether this is a True or False for change so that we can store both in the map.
-        key = f'{meta.qualified_key}+{rebuild_hint.rebuild}'
+        key = meta.qualified_key + ('+True' if rebuild_hint.rebuild else '+False')
         # If the key is already there, don't replace the message as it is likely more interesting
         # than subsequent reasons (e.g. changing because of ancestry)
         if key not in self.assessment_reason:
             self.assessment_reason[key] = rebuild_hint.reason
 
+    def _get_descendants(self, meta: ImageMetadata) -> Set[ImageMetadata]:
+        """
+        Same as meta.get_descendants(), but memoizes the result for every image in the subtree,
+        so that each part of the image tree is walked only once per scan
+        """
+        descendants = self._descendants_cache.get(meta.distgit_key)
+        if descendants is None:
+            descendants = set()
+            for child in meta.children:
+                descendants.add(child)
+                descendants.update(self._get_descendants(child))
+            self._descendants_cache[meta.distgit_key] = descendants
+        return descendants
+
     def add_image_meta_change(self, meta: ImageMetadata, rebuild_hint: RebuildHint):
         self.changing_image_metas.add(meta)
         self.add_assessment_reason(meta, rebuild_hint)
-        for descendant_meta in meta.get_descendants():
+        for descendant_meta in self._get_descendants(meta):
             self.changing_image_metas.add(descendant_meta)
             self.add_assessment_reason(
                 descendant_meta,
@@ -538,33 +638,24 @@ class ConfigScanSources:
             )
 
     async def generate_report(self):
-        image_results = []
-        changing_image_dgks = [meta.distgit_key for meta in self.changing_image_metas]
-        for image_meta in self.all_image_metas:
-            dgk = image_meta.distgit_key
-            is_changing = dgk in changing_image_dgks
-            if is_changing:
-                image_results.append(
-                    {
-                        'name': dgk,
-                        'changed': is_changing,
-                        'reason': self.assessment_reason.get(f'{image_meta.qualified_key}+{is_changing}'),
-                    }
-                )
+        # Only changing metas end up in the report: no need to go through all of them
+        image_results = [
+            {
+                'name': image_meta.distgit_key,
+                'changed': True,
+                'reason': self.assessment_reason.get(image_meta.qualified_key + '+True'),
+            }
+            for image_meta in sorted(self.changing_image_metas, key=lambda meta: meta.distgit_key)
+        ]
 
-        rpm_results = []
-        changing_rpm_dgks = [meta.distgit_key for meta in self.changing_rpm_metas]
-        for rpm_meta in self.all_rpm_metas:
-            dgk = rpm_meta.distgit_key
-            is_changing = dgk in changing_rpm_dgks
-            if is_changing:
-                rpm_results.append(
-                    {
-                        'name': dgk,
-                        'changed': is_changing,
-                        'reason': self.assessment_reason.get(f'{rpm_meta.qualified_key}+{is_changing}'),
-                    }
-                )
+        rpm_results = [
+            {
+                'name': rpm_meta.distgit_key,
+                'changed': True,
+                'reason': self.assessment_reason.get(rpm_meta.qualified_key + '+True'),
+            }
+            for rpm_meta in sorted(self.changing_rpm_metas, key=lambda meta: meta.distgit_key)
+        ]
 
         results = dict(
             rpms=rpm_results,
@@ -581,23 +672,27 @@ class ConfigScanSources:
             results['issues'] = self.issues
             click.echo(yaml.safe_dump(results, indent=4))
         else:
+            # Build the whole report first and write it out at once
+            lines = []
             # Log change results
             for kind, items in results.items():
                 if not items:
                     continue
-                click.echo(kind.upper() + ":")
+                lines.append(kind.upper() + ":")
                 for item in items:
-                    click.echo(
+                    lines.append(
                         '  {} is {} (reason: {})'.format(
                             item['name'], 'changed' if item['changed'] else 'the same', item['reason']
                         )
                     )
             # Log issues
-            click.echo("ISSUES:")
-            for item in self.issues:
-                click.echo(f"   {item['name']}: {item['issue']}")
+            lines.append("ISSUES:")
+            lines.extend(f"   {item['name']}: {item['issue']}" for item in self.issues)
+            click.echo('\n'.join(lines))
 
-        self.runtime.logger.debug(f'KojiWrapper cache size: {int(brew.KojiWrapper.get_cache_size() / 1024)}KB')
+        # get_cache_size() walks the whole koji cache; only pay for it when the result is logged
+        if self.runtime.logger.isEnabledFor(logging.DEBUG):
+            self.runtime.logger.debug('KojiWrapper cache size: %dKB', brew.KojiWrapper.get_cache_size() // 1024)
 
     def _latest_rhcos_build_id(self, version, arch, private) -> Optional[str]:
         """
@@ -625,71 +720,92 @@ class ConfigScanSources:
                 'reason': "could not find an RHCOS build to sync",
             }
         """
-        statuses = []
 
         version = self.runtime.get_minor_version()
-        major, minor = self.runtime.get_major_minor_fields()
         primary_container = get_primary_container_name(self.runtime)
-        for arch in self.runtime.arches:
-            for private in (False, True):
-                status = dict(name=f"{version}-{arch}{'-priv' if private else ''}")
-                if self.runtime.group_config.rhcos.get("layered_rhcos", False):
-                    tagged_rhcos_value = self._tagged_rhcos_node_digest(primary_container, version, arch, private)
-                    latest_rhcos_value = self._latest_rhcos_node_shasum(arch)
-                else:
-                    tagged_rhcos_value = self._tagged_rhcos_id(primary_container, version, arch, private)
-                    latest_rhcos_value = self._latest_rhcos_build_id(version, arch, private)
-
-                if latest_rhcos_value and tagged_rhcos_value != latest_rhcos_value:
-                    status['updated'] = True
-                    status['changed'] = True
-                    status['reason'] = (
-                        f"latest RHCOS build is {latest_rhcos_value} which differs from istag {tagged_rhcos_value}"
-                    )
-                    statuses.append(status)
-                # check outdate rpms in rhcos
-                pullspec_for_tag = dict()
-                build_id = ""
-                for container_conf in self.runtime.group_config.rhcos.payload_tags:
-                    build_id, pullspec = rhcos.RHCOSBuildFinder(self.runtime, version, arch, private).latest_container(
-                        container_conf
-                    )
-                    pullspec_for_tag[container_conf.name] = pullspec
-                non_latest_rpms = await rhcos.RHCOSBuildInspector(
-                    self.runtime, pullspec_for_tag, arch, build_id
-                ).find_non_latest_rpms(exclude_rhel=True)
-                non_latest_rpms_filtered = []
-
-                # exclude rpm if non_latest_rpms in rhel image rpm list
-                exclude_rpms = self.runtime.group_config.rhcos.get("exempt_rpms", [])
-                for installed_rpm, latest_rpm, repo in non_latest_rpms:
-                    if any(excluded in installed_rpm for excluded in exclude_rpms):
-                        self.runtime.logger.info(
-                            f"[EXEMPT SKIPPED] Exclude {installed_rpm} because its in the exempt list when {latest_rpm} was available in repo {repo}"
-                        )
-                    else:
-                        non_latest_rpms_filtered.append((installed_rpm, latest_rpm, repo))
-                if non_latest_rpms_filtered:
-                    status['outdated'] = True
-                    status['changed'] = True
-                    status['reason'] = ";\n".join(
+        base_namespace = rgp.default_imagestream_namespace_base_name()
+        base_name = rgp.default_imagestream_base_name(version, self.runtime)
+
+        # Each (arch, private) pair is independent: check them concurrently
+        statuses_per_pair = await asyncio.gather(
+            *[
+                self._detect_rhcos_status_for(primary_container, version, base_namespace, base_name, arch, private)
+                for arch in self.runtime.arches
+                for private in (False, True)
+            ]
+        )
+        return [status for statuses in statuses_per_pair for status in statuses]
+
+    async def _detect_rhcos_status_for(
+        self, primary_container, version, base_namespace, base_name, arch, private
+    ) -> list:
+        """
+        Check RHCOS status for a single arch, in either the public or the private imagestream
+        """
+
+        statuses = []
+        name = f"{version}-{arch}{'-priv' if private else ''}"
+        if self.runtime.group_config.rhcos.get("layered_rhcos", False):
+            tagged_rhcos_value, latest_rhcos_value = await asyncio.gather(
+                self._tagged_rhcos_node_digest(primary_container, base_namespace, base_name, arch, private),
+                exectools.to_thread(self._latest_rhcos_node_shasum, arch),
+            )
+        else:
+            tagged_rhcos_value, latest_rhcos_value = await asyncio.gather(
+                self._tagged_rhcos_id(primary_container, base_namespace, base_name, arch, private),
+                exectools.to_thread(self._latest_rhcos_build_id, version, arch, private),
+            )
+
+        if latest_rhcos_value and tagged_rhcos_value != latest_rhcos_value:
+            statuses.append(
+                {
+                    'name': name,
+                    'changed': True,
+                    'updated': True,
+                    'reason': f"latest RHCOS build is {latest_rhcos_value} which differs from istag {tagged_rhcos_value}",
+                }
+            )
+        # check outdate rpms in rhcos
+        pullspec_for_tag = dict()
+        build_id = ""
+        build_finder = rhcos.RHCOSBuildFinder(self.runtime, version, arch, private)
+        for container_conf in self.runtime.group_config.rhcos.payload_tags:
+            build_id, pullspec = await exectools.to_thread(build_finder.latest_container, container_conf)
+            pullspec_for_tag[container_conf.name] = pullspec
+        # The inspector fetches RHCOS build metadata over HTTP as it is created: keep that off the event loop
+        build_inspector = await exectools.to_thread(
+            rhcos.RHCOSBuildInspector, self.runtime, pullspec_for_tag, arch, build_id
+        )
+        non_latest_rpms = await build_inspector.find_non_latest_rpms(exclude_rhel=True)
+        non_latest_rpms_filtered = []
+
+        # exclude rpm if non_latest_rpms in rhel image rpm list
+        exclude_rpms = self.runtime.group_config.rhcos.get("exempt_rpms", [])
+        for installed_rpm, latest_rpm, repo in non_latest_rpms:
+            if any(excluded in installed_rpm for excluded in exclude_rpms):
+                self.runtime.logger.info(
+                    f"[EXEMPT SKIPPED] Exclude {installed_rpm} because its in the exempt list when {latest_rpm} was available in repo {repo}"
+                )
+            else:
+                non_latest_rpms_filtered.append((installed_rpm, latest_rpm, repo))
+        if non_latest_rpms_filtered:
+            statuses.append(
+                {
+                    'name': name,
+                    'changed': True,
+                    'outdated': True,
+                    'reason': ";\n".join(
                         f"Outdated RPM {installed_rpm} installed in RHCOS ({arch}) when {latest_rpm} was available in repo {repo}"
                         for installed_rpm, latest_rpm, repo in non_latest_rpms_filtered
-                    )
-                    statuses.append(status)
+                    ),
+                }
+            )
         return statuses
 
-    def _tagged_rhcos_id(self, container_name, version, arch, private) -> Optional[str]:
+    async def _tagged_rhcos_id(self, container_name, base_namespace, base_name, arch, private) -> Optional[str]:
         """determine the most recently tagged RHCOS in given imagestream"""
-        base_namespace = rgp.default_imagestream_namespace_base_name()
-        base_name = rgp.default_imagestream_base_name(version, self.runtime)
         namespace, name = rgp.payload_imagestream_namespace_and_name(base_namespace, base_name, arch, private)
-        stdout, _ = exectools.cmd_assert(
-            f"oc --kubeconfig '{self.ci_kubeconfig}' --namespace '{namespace}' get istag '{name}:{container_name}' -o json",
-            retries=3,
-            pollrate=5,
-            strip=True,
-        )
+        stdout = await self._istag_lookup.get_istag(namespace, f'{name}:{container_name}')
 
         try:
             istagdata = json.loads(stdout)
@@ -706,17 +822,12 @@ class ConfigScanSources:
 
         return build_id
 
-    def _tagged_rhcos_node_digest(self, container_name, version, arch, private) -> Optional[str]:
+    async def _tagged_rhcos_node_digest(
+        self, container_name, base_namespace, base_name, arch, private
+    ) -> Optional[str]:
         """get latest coreos image diget from tagged RHCOS in given imagestream"""
-        base_namespace = rgp.default_imagestream_namespace_base_name()
-        base_name = rgp.default_imagestream_base_name(version, self.runtime)
         namespace, name = rgp.payload_imagestream_namespace_and_name(base_namespace, base_name, arch, private)
-        stdout, _ = exectools.cmd_assert(
-            f"oc --kubeconfig '{self.ci_kubeconfig}' --namespace '{namespace}' get istag '{name}:{container_name}' -o json",
-            retries=3,
-            pollrate=5,
-            strip=True,
-        )
+        stdout = await self._istag_lookup.get_istag(namespace, f'{name}:{container_name}')
 
         try:
             istagdata = json.loads(stdout)
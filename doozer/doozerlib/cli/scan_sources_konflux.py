@@ -5,15 +5,16 @@ import logging
 import os
 import random
 import tempfile
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from functools import wraps
-from typing import Dict, List, Optional, cast
+from functools import lru_cache, wraps
+from typing import Dict, List, Optional, Set, Tuple, cast
 
 import aiohttp
 import artcommonlib.util
 import click
-import dateutil.parser
 import pycares
+import pygit2
 import yaml
 from artcommonlib import exectools
 from artcommonlib.arch_util import brew_arch_for_go_arch, go_arch_for_brew_arch
@@ -47,6 +48,16 @@ DEFAULT_THRESHOLD_HOURS = 6
 TASK_BUNDLE_AGE_THRESHOLD_DAYS = 10
 
 
+@lru_cache
+def _parse_rebase_time(rebase_time: str) -> datetime:
+    """
+    Parse a rebase timestamp isolated from a build release field, e.g. 20250101120000.
+    Dependency timestamps are compared against every dependent, so parsed values are memoized
+    """
+
+    return datetime.strptime(rebase_time, "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
+
+
 class ConfigScanSources:
     def __init__(
         self,
@@ -95,6 +106,11 @@ class ConfigScanSources:
         self.rhcos_status = []
         self.registry_auth_file = os.getenv("KONFLUX_ART_IMAGES_AUTH_FILE")
         self.current_task_bundles: Dict[str, str] = {}
+        self._sha_cache: Dict[Tuple[str, str], str] = {}  # maps (remote url, ref) => latest commit SHA
+        self.db_semaphore = asyncio.Semaphore(32)  # bounds concurrent Konflux DB queries across image scans
+        self._upstream_commit_hashes: Dict[tuple, str] = {}  # maps (url, target, fallback, stage) => commit hash
+        self._descendants_cache: Dict[str, Set[ImageMetadata]] = {}  # maps distgit_key => descendant metas
+        self._istag_lookup = rhcos.CIClusterIstagLookup(ci_kubeconfig)
 
     def _is_okd_enabled(self, image_meta: ImageMetadata) -> bool:
         """
@@ -162,7 +178,7 @@ class ConfigScanSources:
                     'ocp4-scan for Konflux is not allowed to rebase into openshfit-priv version %s', version
                 )
             else:
-                self.rebase_into_priv()
+                await self.rebase_into_priv()
 
         # Gather latest builds for ART-managed RPMs
         await self.find_latest_rpms_builds()
@@ -176,6 +192,17 @@ class ConfigScanSources:
         # Build an image dependency tree to scan across levels of inheritance. This should save us some time,
         # as when an image is found in need for a rebuild, we can also mark its children or operators without checking
         self.image_tree = self.generate_dependency_tree(self.runtime.image_tree)
+
+        # Gather latest builds for all levels at once, rather than one round of DB queries per level
+        await self.find_latest_image_builds(
+            [
+                image_name
+                for level in self.image_tree.values()
+                for image_name in level
+                if self._is_image_enabled(self.runtime.image_map[image_name])
+            ]
+        )
+
         for level in sorted(self.image_tree.keys()):
             await self.scan_images(self.image_tree[level])
 
@@ -186,11 +213,19 @@ class ConfigScanSources:
         # Print the output report
         self.generate_report()
 
-    def _try_reconciliation(self, metadata: Metadata, repo_name: str, pub_branch_name: str, priv_branch_name: str):
+    @retry(reraise=True, stop=stop_after_attempt(3), wait=wait_fixed(5))
+    async def _push_to_priv(self, path: str, priv_branch_name: str):
+        await exectools.cmd_assert_async(['git', 'push', 'origin', priv_branch_name], cwd=path)
+
+    async def _try_reconciliation(
+        self, metadata: Metadata, path: str, repo_name: str, pub_branch_name: str, priv_branch_name: str
+    ):
         reconciled = False
 
         # Attempt a fast-forward merge
-        rc, _, _ = exectools.cmd_gather(cmd=['git', 'pull', '--ff-only', 'public_upstream', pub_branch_name])
+        rc, _, _ = await cmd_gather_async(
+            ['git', 'pull', '--ff-only', 'public_upstream', pub_branch_name], check=False, cwd=path
+        )
         if not rc:
             # fast-forward succeeded, will push to openshift-priv
             self.logger.info('Fast-forwarded %s from public_upstream/%s', metadata.name, pub_branch_name)
@@ -198,17 +233,18 @@ class ConfigScanSources:
 
         else:
             # fast-forward failed, trying a merge commit
-            rc, _, _ = exectools.cmd_gather(
-                cmd=[
+            rc, out, err = await cmd_gather_async(
+                [
                     'git',
                     'merge',
                     f'public_upstream/{pub_branch_name}',
                     '-m',
                     f'Reconciled {repo_name} with public upstream',
                 ],
-                log_stderr=True,
-                log_stdout=True,
+                check=False,
+                cwd=path,
             )
+            self.logger.debug('git merge output for %s:\nstdout: %s\nstderr: %s', metadata.name, out, err)
             if not rc:
                 # merge succeeded, will push to openshift-priv
                 reconciled = True
@@ -230,7 +266,7 @@ class ConfigScanSources:
 
         # Try to push to openshift-priv
         try:
-            exectools.cmd_assert(cmd=['git', 'push', 'origin', priv_branch_name], retries=3)
+            await self._push_to_priv(path, priv_branch_name)
             self.logger.info('Successfully reconciled %s with public upstream', metadata.name)
 
         except ChildProcessError:
@@ -238,26 +274,170 @@ class ConfigScanSources:
             self.logger.warning('failed pushing to openshift-priv for %s', metadata.name)
             self.issues.append({'name': metadata.distgit_key, 'issue': 'Failed pushing to openshift-priv'})
 
-    def _do_shas_match(self, public_url, pub_branch_name, priv_url, priv_branch_name) -> bool:
+    @retry(reraise=True, stop=stop_after_attempt(5), wait=wait_fixed(5))
+    async def _ls_remote(self, url: str, refs: List[str]) -> str:
         """
-        Use GitHub API to check commit SHAs on private and public upstream for a given branch.
-        Return True if they match, False otherwise
+        List the given refs on a remote with a single git ls-remote call
+        """
+
+        _, out, _ = await cmd_gather_async(['git', 'ls-remote', url, *refs])
+        return out
+
+    @staticmethod
+    def _parse_ref_advertisement(data: bytes) -> str:
+        """
+        Decode a smart HTTP ref advertisement (pkt-line format) into git ls-remote output,
+        i.e. one '<sha>\t<ref>' line per advertised ref
         """
 
+        lines = []
+        pos = 0
+        while pos + 4 <= len(data):
+            pkt_len = int(data[pos : pos + 4], 16)
+            if pkt_len == 0:  # flush-pkt
+                pos += 4
+                continue
+            payload = data[pos + 4 : pos + pkt_len].decode('utf-8').rstrip('\n')
+            pos += pkt_len
+            if payload.startswith('#'):  # service announcement
+                continue
+            # Capabilities are advertised after a NUL byte on the first ref line
+            sha, _, ref_name = payload.split('\0', 1)[0].partition(' ')
+            if ref_name and ref_name != 'capabilities^{}':
+                lines.append(f'{sha}\t{ref_name}')
+        return '\n'.join(lines)
+
+    async def _ls_remote_http(self, url: str) -> Optional[str]:
+        """
+        List the refs of a remote in-process through the git smart HTTP protocol,
+        reusing the scanner HTTP session instead of spawning git ls-remote.
+        Return the refs in git ls-remote output format, or None if they could not be retrieved
+        """
+
+        https_url = artcommonlib.util.convert_remote_git_to_https(url).rstrip('/')
+        if not https_url.startswith('https://'):
+            return None
+        if not https_url.endswith('.git'):
+            https_url += '.git'
+
+        headers = {}
+        if https_url.startswith('https://github.com/') and self.github_token:
+            credentials = base64.b64encode(f'x-access-token:{self.github_token}'.encode()).decode()
+            headers['Authorization'] = f'Basic {credentials}'
+
         try:
-            # Check public commit ID
-            out, _ = exectools.cmd_assert(
-                ['git', 'ls-remote', public_url, pub_branch_name], retries=5, on_retry='sleep 5'
-            )
-            pub_commit = out.strip().split()[0]
+            async with self.session.get(
+                f'{https_url}/info/refs', params={'service': 'git-upload-pack'}, headers=headers
+            ) as response:
+                response.raise_for_status()
+                if response.content_type != 'application/x-git-upload-pack-advertisement':
+                    # Dumb HTTP server or login page: let git handle it
+                    return None
+                return self._parse_ref_advertisement(await response.read())
 
-            # Check private commit ID
-            out, _ = exectools.cmd_assert(
-                ['git', 'ls-remote', priv_url, priv_branch_name], retries=5, on_retry='sleep 5'
-            )
-            priv_commit = out.strip().split()[0]
+        except (aiohttp.ClientError, ValueError) as e:
+            self.logger.info('Could not list refs of %s over smart HTTP: %s', url, e)
+            return None
 
-        except ChildProcessError:
+    async def _github_branch_sha(self, url: str, ref: str) -> Optional[str]:
+        """
+        Use GitHub API to get the latest commit SHA of a ref on a GitHub repository.
+        Return None if the SHA could not be retrieved
+        """
+
+        _, org, repo_name = artcommonlib.util.split_git_url(url)
+        try:
+            async with self.session.get(
+                f'https://api.github.com/repos/{org}/{repo_name}/commits/{ref}',
+                headers={'Authorization': f'Bearer {self.github_token}', 'Accept': 'application/vnd.github.sha'},
+            ) as response:
+                response.raise_for_status()
+                return (await response.text()).strip()
+
+        except aiohttp.ClientError as e:
+            self.logger.info('Could not get latest commit SHA of %s from GitHub API: %s', url, e)
+            return None
+
+    async def _github_compare_status(self, url: str, base: str, head: str) -> Optional[str]:
+        """
+        Use GitHub compare API to tell how head relates to base on a GitHub repository:
+        one of 'identical', 'ahead', 'behind' or 'diverged'.
+        Return None if the comparison could not be retrieved
+        """
+
+        _, org, repo_name = artcommonlib.util.split_git_url(url)
+        try:
+            async with self.session.get(
+                f'https://api.github.com/repos/{org}/{repo_name}/compare/{base}...{head}',
+                params={'per_page': '1'},
+                headers={'Authorization': f'Bearer {self.github_token}', 'Accept': 'application/vnd.github+json'},
+            ) as response:
+                response.raise_for_status()
+                return (await response.json())['status']
+
+        except (aiohttp.ClientError, KeyError) as e:
+            self.logger.info('Could not compare %s...%s on %s with GitHub API: %s', base, head, url, e)
+            return None
+
+    async def _prefetch_remote_shas(self, remote_refs: List[Tuple[str, str]]):
+        """
+        Resolve the latest commit SHA of each (url, ref) pair and store it into self._sha_cache.
+        GitHub refs are resolved through the GitHub API. Other refs, and the ones the API could not resolve,
+        are grouped by remote, so that each remote is queried only once: over smart HTTP when possible,
+        falling back to git ls-remote otherwise.
+        """
+
+        semaphore = asyncio.Semaphore(20)
+
+        async def _fetch_from_github(url: str, ref: str):
+            async with semaphore:
+                sha = await self._github_branch_sha(url, ref)
+            if sha:
+                self._sha_cache[(url, ref)] = sha
+
+        async def _fetch_from_remote(url: str, refs: Set[str]):
+            async with semaphore:
+                out = await self._ls_remote_http(url)
+                if out is None:
+                    try:
+                        out = await self._ls_remote(url, sorted(refs))
+                    except ChildProcessError:
+                        self.logger.warning('Could not fetch latest commit SHAs from %s', url)
+                        return
+
+            for ref in refs:
+                # Same matching rules as git ls-remote patterns: the first ref that matches wins
+                for line in out.splitlines():
+                    sha, _, ref_name = line.partition('\t')
+                    if ref_name == ref or ref_name.endswith(f'/{ref}'):
+                        self._sha_cache[(url, ref)] = sha
+                        break
+
+        remote_refs = set(remote_refs)
+        await asyncio.gather(
+            *[
+                _fetch_from_github(url, ref)
+                for url, ref in remote_refs
+                if artcommonlib.util.convert_remote_git_to_https(url).startswith('https://github.com/')
+            ]
+        )
+
+        refs_by_url: Dict[str, Set[str]] = defaultdict(set)
+        for url, ref in remote_refs:
+            if (url, ref) not in self._sha_cache:
+                refs_by_url[url].add(ref)
+        await asyncio.gather(*[_fetch_from_remote(url, refs) for url, refs in refs_by_url.items()])
+
+    def _do_shas_match(self, public_url, pub_branch_name, priv_url, priv_branch_name) -> bool:
+        """
+        Check commit SHAs on private and public upstream for a given branch, as prefetched by _prefetch_remote_shas()
+        Return True if they match, False otherwise
+        """
+
+        pub_commit = self._sha_cache.get((public_url, pub_branch_name))
+        priv_commit = self._sha_cache.get((priv_url, priv_branch_name))
+
+        if not pub_commit or not priv_commit:
             self.logger.warning('Could not fetch latest commit SHAs from %s: skipping rebase', public_url)
             return True
 
@@ -278,48 +458,50 @@ class ConfigScanSources:
         If a reconciliation already happened, private upstream might have a merge commit thus be a descendant
         of the public upstream. In this case, we don't need to rebase public into priv
 
-        Use merge-base --is-ancestor to determine if public upstream is an ancestor of the private one
+        Use libgit2 to determine in-process if public upstream is an ancestor of the private one,
+        rather than forking git merge-base --is-ancestor for every repo
         """
 
-        with Dir(path):
-            # Check if the first <commit> is an ancestor of the second <commit>,
-            # and exit with status 0 if true, or with status 1 if not.
-            # Errors are signaled by a non-zero status that is not 1.
-            rc, _, _ = exectools.cmd_gather(
-                [
-                    'git',
-                    'merge-base',
-                    '--is-ancestor',
-                    f'public_upstream/{pub_branch_name}',
-                    f'origin/{priv_branch_name}',
-                ]
-            )
-        if rc == 1:
-            self.logger.info('Public upstream is ahead of private for %s: will need to rebase', repo_name)
-            return False
-        if rc == 0:
+        try:
+            repo = pygit2.Repository(path)
+            pub_commit = repo.revparse_single(f'public_upstream/{pub_branch_name}').peel(pygit2.Commit).id
+            priv_commit = repo.revparse_single(f'origin/{priv_branch_name}').peel(pygit2.Commit).id
+            # A commit is considered an ancestor of itself, matching merge-base --is-ancestor
+            is_ancestor = pub_commit == priv_commit or repo.descendant_of(priv_commit, pub_commit)
+        except (pygit2.GitError, KeyError, ValueError) as e:
+            raise IOError(f'Could not determine ancestry between public and private upstreams for {repo_name}') from e
+
+        if is_ancestor:
             self.logger.info('Private upstream is ahead of public for %s: no need to rebase', repo_name)
             return True
-        raise IOError(f'Could not determine ancestry between public and private upstreams for {repo_name}')
+        self.logger.info('Public upstream is ahead of private for %s: will need to rebase', repo_name)
+        return False
 
-    def rebase_into_priv(self):
+    @staticmethod
+    def _has_sha_branch(metadata: Metadata) -> bool:
+        """
+        Return True if the upstream source of a component is pinned to a commit hash rather than a branch
+        """
+
+        try:
+            int(metadata.config.content.source.git.branch.target, 16)
+            return True
+        except (TypeError, ValueError):
+            # target branch is a normal branch name
+            return False
+
+    async def rebase_into_priv(self):
         if self.dry_run:
             self.logger.info('Would have rebased into openshift-priv')
             return
 
         self.logger.info('Rebasing public upstream contents into openshift-priv')
-        upstream_mappings = exectools.parallel_exec(
-            lambda meta, _: (
-                meta,
-                SourceResolver.get_public_upstream(
-                    meta.config.content.source.git.url, self.runtime.group_config.public_upstreams
-                ),
-            ),
-            self.all_metas,
-            n_threads=20,
-        ).get()
 
-        for metadata, public_upstream in upstream_mappings:
+        # Components that have a public counterpart to be reconciled with:
+        # (metadata, public_url, public_branch_name, priv_branch_name, priv_repo_name)
+        rebase_candidates = []
+
+        for metadata in self.all_metas:
             # Skip rebase for disabled components
             if metadata.meta_type == 'image':
                 # For images: use OKD-aware enabled check
@@ -339,7 +521,14 @@ class ConfigScanSources:
                 )
                 continue
 
-            public_url, public_branch_name, has_public_upstream = public_upstream
+            # If a git commit hash was declared as the upstream source, skip the rebase before resolving any URL
+            if self._has_sha_branch(metadata):
+                self.logger.warning('Target branch for %s is a SHA: skipping rebase', metadata.name)
+                continue
+
+            public_url, public_branch_name, has_public_upstream = SourceResolver.get_public_upstream(
+                metadata.config.content.source.git.url, self.runtime.group_config.public_upstreams
+            )
 
             # If no public upstream exists, skip the rebase
             if not has_public_upstream:
@@ -353,17 +542,6 @@ class ConfigScanSources:
             priv_url = artcommonlib.util.convert_remote_git_to_https(metadata.config.content.source.git.url)
             priv_branch_name = metadata.config.content.source.git.branch.target
 
-            # If a git commit hash was declared as the upstream source, skip the rebase
-            try:
-                _ = int(priv_branch_name, 16)
-                # target branch is a sha: skip rebase for this component
-                self.logger.warning('Target branch for %s is a SHA: skipping rebase', metadata.name)
-                continue
-
-            except ValueError:
-                # target branch is a normal branch name
-                pass
-
             # If no public_upstreams field exists, public_branch_name will be None
             public_branch_name = public_branch_name or priv_branch_name
 
@@ -376,26 +554,82 @@ class ConfigScanSources:
                 )
                 continue
 
-            # First, quick check: if SHAs match across remotes, repo is synced and we can avoid cloning it
-            _, public_org, public_repo_name = artcommonlib.util.split_git_url(public_url)
-            _, priv_org, priv_repo_name = artcommonlib.util.split_git_url(priv_url)
+            _, _, priv_repo_name = artcommonlib.util.split_git_url(priv_url)
+            rebase_candidates.append((metadata, public_url, public_branch_name, priv_branch_name, priv_repo_name))
+
+        # Fetch latest commit SHAs for all candidates upfront, with one ls-remote call per remote
+        remote_refs = []
+        for metadata, public_url, public_branch_name, priv_branch_name, _ in rebase_candidates:
+            remote_refs.append((public_url, public_branch_name))
+            remote_refs.append((metadata.config.content.source.git.url, priv_branch_name))
+        await self._prefetch_remote_shas(remote_refs)
+
+        # Components sharing a private branch are reconciled one after the other, so that their pushes don't race.
+        # Distinct branches are reconciled concurrently, with a bound on clones and merges as they are disk heavy.
+        candidates_by_priv_branch: Dict[Tuple[str, str], list] = defaultdict(list)
+        for candidate in rebase_candidates:
+            metadata, _, _, priv_branch_name, _ = candidate
+            priv_url = artcommonlib.util.convert_remote_git_to_https(metadata.config.content.source.git.url)
+            candidates_by_priv_branch[(priv_url, priv_branch_name)].append(candidate)
 
-            if self._do_shas_match(
-                public_url, public_branch_name, metadata.config.content.source.git.url, priv_branch_name
-            ):
-                # If they match, do nothing
-                continue
+        semaphore = asyncio.Semaphore(4)
 
-            # If they don't, clone source repo
-            path = self.runtime.source_resolver.resolve_source(metadata).source_path
+        async def _reconcile_branch(candidates: list):
+            for candidate in candidates:
+                async with semaphore:
+                    await self._reconcile_with_public_upstream(*candidate)
 
-            # SHAs might differ because of previous rebase; let's check the actual content across upstreams
-            if self._is_pub_ancestor_of_priv(path, public_branch_name, priv_branch_name, priv_repo_name):
-                # Private upstream is ahead of public: no need to rebase
-                continue
+        results = await asyncio.gather(
+            *[_reconcile_branch(candidates) for candidates in candidates_by_priv_branch.values()],
+            return_exceptions=True,
+        )
+
+        # Only fail once every branch is done, so that no push to openshift-priv is left in flight
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
-            with Dir(path):
-                self._try_reconciliation(metadata, priv_repo_name, public_branch_name, priv_branch_name)
+    async def _reconcile_with_public_upstream(
+        self,
+        metadata: Metadata,
+        public_url: str,
+        public_branch_name: str,
+        priv_branch_name: str,
+        priv_repo_name: str,
+    ):
+        # First, quick check: if SHAs match across remotes, repo is synced and we can avoid cloning it
+        if self._do_shas_match(
+            public_url, public_branch_name, metadata.config.content.source.git.url, priv_branch_name
+        ):
+            # If they match, do nothing
+            return
+
+        # SHAs might differ because of previous rebase. For GitHub repos, compare the two commits remotely
+        # to avoid cloning the repo only to find out the private upstream is already ahead
+        compare_status = None
+        priv_url = metadata.config.content.source.git.url
+        if artcommonlib.util.convert_remote_git_to_https(priv_url).startswith('https://github.com/'):
+            compare_status = await self._github_compare_status(
+                priv_url,
+                self._sha_cache[(public_url, public_branch_name)],
+                self._sha_cache[(priv_url, priv_branch_name)],
+            )
+            if compare_status in ('identical', 'ahead'):
+                self.logger.info('Private upstream is ahead of public for %s: no need to rebase', priv_repo_name)
+                return
+
+        # Clone source repo
+        source = await exectools.to_thread(self.runtime.source_resolver.resolve_source, metadata)
+        path = source.source_path
+
+        # If the comparison was not available, check the actual content across upstreams
+        if compare_status is None and await exectools.to_thread(
+            self._is_pub_ancestor_of_priv, path, public_branch_name, priv_branch_name, priv_repo_name
+        ):
+            # Private upstream is ahead of public: no need to rebase
+            return
+
+        await self._try_reconciliation(metadata, path, priv_repo_name, public_branch_name, priv_branch_name)
 
     def generate_dependency_tree(self, tree, level=1, levels_dict=None):
         if not levels_dict:
@@ -442,10 +676,13 @@ class ConfigScanSources:
 
     async def find_latest_image_builds(self, image_names: List[str]):
         self.logger.info('Gathering latest image build records information...')
-        # Need installed_packages column for RPM analysis in scan_rpm_changes, so don't exclude any columns
-        latest_image_builds = await asyncio.gather(
-            *[self.runtime.image_map[name].get_latest_build(engine=Engine.KONFLUX.value) for name in image_names]
-        )
+
+        async def _find_latest_build(name: str):
+            # Need installed_packages column for RPM analysis in scan_rpm_changes, so don't exclude any columns
+            async with self.db_semaphore:
+                return await self.runtime.image_map[name].get_latest_build(engine=Engine.KONFLUX.value)
+
+        latest_image_builds = await asyncio.gather(*[_find_latest_build(name) for name in image_names])
         self.latest_image_build_records_map.update((zip(image_names, latest_image_builds)))
 
     async def scan_images(self, image_names: List[str]):
@@ -456,7 +693,9 @@ class ConfigScanSources:
         image_names = list(filter(lambda name: name not in self.changing_image_names, image_names))
 
         # Store latest build records in a map, to reduce DB queries and execution time
-        await self.find_latest_image_builds(image_names)
+        await self.find_latest_image_builds(
+            [name for name in image_names if name not in self.latest_image_build_records_map]
+        )
 
         # Scan images for changes
         scanning_image_metas = [self.runtime.image_map[image_name] for image_name in image_names]
@@ -525,13 +764,22 @@ class ConfigScanSources:
 
     def find_upstream_commit_hash(self, meta: Metadata):
         """
-        Get the upstream latest commit hash using git ls-remote
+        Get the upstream latest commit hash using git ls-remote.
+        Results are cached, as several components may be built from the same repository and branch.
         """
-        use_source_fallback_branch = cast(str, self.runtime.group_config.use_source_fallback_branch or "yes")
-        _, upstream_commit_hash = SourceResolver.detect_remote_source_branch(
-            meta.config.content.source.git, self.runtime.stage, use_source_fallback_branch
+        source_git = meta.config.content.source.git
+        key = (
+            source_git.get('url_pull', source_git.url),
+            source_git.branch.target,
+            source_git.branch.fallback or None,
+            source_git.branch.stage or None,
         )
-        return upstream_commit_hash
+        if key not in self._upstream_commit_hashes:
+            use_source_fallback_branch = cast(str, self.runtime.group_config.use_source_fallback_branch or "yes")
+            _, self._upstream_commit_hashes[key] = SourceResolver.detect_remote_source_branch(
+                source_git, self.runtime.stage, use_source_fallback_branch
+            )
+        return self._upstream_commit_hashes[key]
 
     @skip_check_if_changing
     async def scan_arch_changes(self, image_meta: ImageMetadata):
@@ -600,9 +848,12 @@ class ConfigScanSources:
 
         # Scan for any build in this assembly which includes the git commit.
         upstream_commit_hash = self.find_upstream_commit_hash(image_meta)
-        upstream_commit_build_record = await image_meta.get_latest_build(
-            engine=Engine.KONFLUX.value, extra_patterns={'commitish': upstream_commit_hash}, exclude_large_columns=True
-        )
+        async with self.db_semaphore:
+            upstream_commit_build_record = await image_meta.get_latest_build(
+                engine=Engine.KONFLUX.value,
+                extra_patterns={'commitish': upstream_commit_hash},
+                exclude_large_columns=True,
+            )
 
         # No build from latest upstream commit: handle accordingly
         if not upstream_commit_build_record:
@@ -635,11 +886,12 @@ class ConfigScanSources:
         now = datetime.now(timezone.utc)
 
         # Check whether a build attempt with this commit has failed before.
-        failed_commit_build_record = await image_meta.get_latest_build(
-            extra_patterns={'commitish': upstream_commit_hash},
-            outcome=KonfluxBuildOutcome.FAILURE,
-            exclude_large_columns=True,
-        )
+        async with self.db_semaphore:
+            failed_commit_build_record = await image_meta.get_latest_build(
+                extra_patterns={'commitish': upstream_commit_hash},
+                outcome=KonfluxBuildOutcome.FAILURE,
+                exclude_large_columns=True,
+            )
 
         # If not, this is a net-new upstream commit. Build it.
         if not failed_commit_build_record:
@@ -746,7 +998,7 @@ class ConfigScanSources:
         if not rebase_time:  # no timestamp string in NVR?
             self.logger.warning('No rebase timestamp string in %s, skipping dependency check', build_record.nvr)
             return
-        rebase_time = datetime.strptime(rebase_time, "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
+        rebase_time = _parse_rebase_time(rebase_time)
 
         # Dependencies are parent images, builders of type member, and operands.
         dependencies = image_meta.dependencies.copy()
@@ -782,7 +1034,7 @@ class ConfigScanSources:
                 )
                 continue
 
-            dep_rebase_time = datetime.strptime(dep_rebase_time, "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
+            dep_rebase_time = _parse_rebase_time(dep_rebase_time)
             if dep_rebase_time > rebase_time:
                 self.add_image_meta_change(
                     image_meta, RebuildHint(RebuildHintCode.DEPENDENCY_NEWER, f'Dependency {dep_key} has a newer build')
@@ -850,7 +1102,7 @@ class ConfigScanSources:
         with self.runtime.pooled_koji_client_session() as koji_api:
             builder_brew_build = koji_api.getBuild(builder_build_nvr)
             if builder_brew_build:
-                return dateutil.parser.parse(builder_brew_build['creation_time']).replace(tzinfo=timezone.utc)
+                return datetime.fromisoformat(builder_brew_build['creation_time']).replace(tzinfo=timezone.utc)
 
             # No builder build info?
             self.logger.warning('Could not fetch build info for %s', builder_build_nvr)
@@ -1385,6 +1637,20 @@ class ConfigScanSources:
             self.assessment_reason[key] = rebuild_hint.reason
             self.assessment_code[key] = rebuild_hint.code
 
+    def _get_descendants(self, meta: ImageMetadata) -> Set[ImageMetadata]:
+        """
+        Same as meta.get_descendants(), but memoizes the result for every image in the subtree,
+        so that each part of the image tree is walked only once per scan
+        """
+        descendants = self._descendants_cache.get(meta.distgit_key)
+        if descendants is None:
+            descendants = set()
+            for child in meta.children:
+                descendants.add(child)
+                descendants.update(self._get_descendants(child))
+            self._descendants_cache[meta.distgit_key] = descendants
+        return descendants
+
     def add_image_meta_change(self, meta: ImageMetadata, rebuild_hint: RebuildHint):
         # If the rebuild hint does not require a rebuild, do nothing
         if not rebuild_hint.rebuild:
@@ -1394,7 +1660,7 @@ class ConfigScanSources:
         self.add_assessment_reason(meta, rebuild_hint)
 
         # Mark all descendants for rebuild, so to prevent redundant scans
-        for descendant_meta in meta.get_descendants():
+        for descendant_meta in self._get_descendants(meta):
             self.changing_image_names.add(descendant_meta.distgit_key)
             self.add_assessment_reason(
                 descendant_meta,
@@ -1427,64 +1693,89 @@ class ConfigScanSources:
                 'reason': "could not find an RHCOS build to sync",
             }
         """
-        statuses = []
 
         version = self.runtime.get_minor_version()
         primary_container = get_primary_container_name(self.runtime)
-        for arch in self.runtime.arches:
-            brew_arch = brew_arch_for_go_arch(arch)
-            for private in (False, True):
-                status = dict(name=f"{version}-{brew_arch}{'-priv' if private else ''}")
-                if self.runtime.group_config.rhcos.get("layered_rhcos", False):
-                    tagged_rhcos_value = self.tagged_rhcos_node_digest(primary_container, version, brew_arch, private)
-                    latest_rhcos_value = self.latest_rhcos_node_shasum(arch)
-                else:
-                    tagged_rhcos_value = self.tagged_rhcos_id(primary_container, version, brew_arch, private)
-                    latest_rhcos_value = self.latest_rhcos_build_id(version, brew_arch, private)
-
-                if latest_rhcos_value and tagged_rhcos_value != latest_rhcos_value:
-                    status['updated'] = True
-                    status['changed'] = True
-                    status['reason'] = (
-                        f"latest RHCOS build is {latest_rhcos_value} which differs from istag {tagged_rhcos_value}"
-                    )
-                    statuses.append(status)
-                # check outdate rpms in rhcos
-                pullspec_for_tag = dict()
-                build_id = ""
-                for container_conf in self.runtime.group_config.rhcos.payload_tags:
-                    if self.runtime.group_config.rhcos.get("layered_rhcos", False):
-                        build_id, pullspec = get_latest_layered_rhcos_build(container_conf, brew_arch)
-                    else:
-                        build_id, pullspec = rhcos.RHCOSBuildFinder(
-                            self.runtime, version, brew_arch, private
-                        ).latest_container(container_conf)
-                    pullspec_for_tag[container_conf.name] = pullspec
-                non_latest_rpms = await rhcos.RHCOSBuildInspector(
-                    self.runtime, pullspec_for_tag, brew_arch, build_id
-                ).find_non_latest_rpms(exclude_rhel=True)
-                if non_latest_rpms:
-                    status['outdated'] = True
-                    status['changed'] = True
-                    status['reason'] = ";\n".join(
+        base_namespace = rgp.default_imagestream_namespace_base_name()
+        base_name = rgp.default_imagestream_base_name(version, self.runtime)
+
+        # Each (arch, private) pair is independent: check them concurrently
+        statuses_per_pair = await asyncio.gather(
+            *[
+                self._detect_rhcos_status_for(primary_container, version, base_namespace, base_name, arch, private)
+                for arch in self.runtime.arches
+                for private in (False, True)
+            ]
+        )
+        self.rhcos_status = [status for statuses in statuses_per_pair for status in statuses]
+
+    async def _detect_rhcos_status_for(
+        self, primary_container, version, base_namespace, base_name, arch, private
+    ) -> list:
+        """
+        Check RHCOS status for a single arch, in either the public or the private imagestream
+        """
+
+        statuses = []
+        brew_arch = brew_arch_for_go_arch(arch)
+        name = f"{version}-{brew_arch}{'-priv' if private else ''}"
+        layered_rhcos = self.runtime.group_config.rhcos.get("layered_rhcos", False)
+        if layered_rhcos:
+            tagged_rhcos_value, latest_rhcos_value = await asyncio.gather(
+                self.tagged_rhcos_node_digest(primary_container, base_namespace, base_name, brew_arch, private),
+                self.latest_rhcos_node_shasum(arch),
+            )
+        else:
+            tagged_rhcos_value, latest_rhcos_value = await asyncio.gather(
+                self.tagged_rhcos_id(primary_container, base_namespace, base_name, brew_arch, private),
+                exectools.to_thread(self.latest_rhcos_build_id, version, brew_arch, private),
+            )
+
+        if latest_rhcos_value and tagged_rhcos_value != latest_rhcos_value:
+            statuses.append(
+                {
+                    'name': name,
+                    'changed': True,
+                    'updated': True,
+                    'reason': f"latest RHCOS build is {latest_rhcos_value} which differs from istag {tagged_rhcos_value}",
+                }
+            )
+        # check outdate rpms in rhcos
+        pullspec_for_tag = dict()
+        build_id = ""
+        for container_conf in self.runtime.group_config.rhcos.payload_tags:
+            if layered_rhcos:
+                build_id, pullspec = await exectools.to_thread(
+                    get_latest_layered_rhcos_build, container_conf, brew_arch
+                )
+            else:
+                build_id, pullspec = await exectools.to_thread(
+                    rhcos.RHCOSBuildFinder(self.runtime, version, brew_arch, private).latest_container, container_conf
+                )
+            pullspec_for_tag[container_conf.name] = pullspec
+        # The inspector fetches RHCOS build metadata over HTTP as it is created: keep that off the event loop
+        build_inspector = await exectools.to_thread(
+            rhcos.RHCOSBuildInspector, self.runtime, pullspec_for_tag, brew_arch, build_id
+        )
+        non_latest_rpms = await build_inspector.find_non_latest_rpms(exclude_rhel=True)
+        if non_latest_rpms:
+            statuses.append(
+                {
+                    'name': name,
+                    'changed': True,
+                    'outdated': True,
+                    'reason': ";\n".join(
                         f"Outdated RPM {installed_rpm} installed in RHCOS ({brew_arch}) when {latest_rpm} was available in repo {repo}"
                         for installed_rpm, latest_rpm, repo in non_latest_rpms
-                    )
-                    statuses.append(status)
-
-        self.rhcos_status = statuses
+                    ),
+                }
+            )
+        return statuses
 
-    def tagged_rhcos_node_digest(self, container_name, version, arch, private) -> Optional[str]:
+    async def tagged_rhcos_node_digest(self, container_name, base_namespace, base_name, arch, private) -> Optional[str]:
         """get latest coreos image diget from tagged RHCOS in given imagestream"""
-        base_namespace = rgp.default_imagestream_namespace_base_name()
-        base_name = rgp.default_imagestream_base_name(version, self.runtime)
         namespace, name = rgp.payload_imagestream_namespace_and_name(base_namespace, base_name, arch, private)
-        stdout, _ = exectools.cmd_assert(
-            f"oc --kubeconfig '{self.ci_kubeconfig}' --namespace '{namespace}' get istag '{name}:{container_name}' -o json",
-            retries=3,
-            pollrate=5,
-            strip=True,
-        )
+        stdout = await self._istag_lookup.get_istag(namespace, f'{name}:{container_name}')
 
         try:
             istagdata = json.loads(stdout)
@@ -1496,26 +1787,19 @@ class ConfigScanSources:
 
         return shasum
 
-    def latest_rhcos_node_shasum(self, arch) -> Optional[str]:
+    async def latest_rhcos_node_shasum(self, arch) -> Optional[str]:
         """get latest node image from quay.io/openshift-release-dev/ocp-v4.0-art-dev:4.x-9.x-node-image"""
         go_arch = go_arch_for_brew_arch(arch)
         rhcos_index = next(
             (tag.rhcos_index_tag for tag in self.runtime.group_config.rhcos.payload_tags if tag.primary), ""
         )
-        rhcos_info = util.oc_image_info_for_arch(rhcos_index, go_arch)
+        rhcos_info = await exectools.to_thread(util.oc_image_info_for_arch, rhcos_index, go_arch)
         return rhcos_info['digest']
 
-    def tagged_rhcos_id(self, container_name, version, arch, private) -> Optional[str]:
+    async def tagged_rhcos_id(self, container_name, base_namespace, base_name, arch, private) -> Optional[str]:
         """determine the most recently tagged RHCOS in given imagestream"""
-        base_namespace = rgp.default_imagestream_namespace_base_name()
-        base_name = rgp.default_imagestream_base_name(version, self.runtime)
         namespace, name = rgp.payload_imagestream_namespace_and_name(base_namespace, base_name, arch, private)
-        stdout, _ = exectools.cmd_assert(
-            f"oc --kubeconfig '{self.ci_kubeconfig}' --namespace '{namespace}' get istag '{name}:{container_name}' -o json",
-            retries=3,
-            pollrate=5,
-            strip=True,
-        )
+        stdout = await self._istag_lookup.get_istag(namespace, f'{name}:{container_name}')
 
         try:
             istagdata = json.loads(stdout)
@@ -1552,7 +1836,7 @@ class ConfigScanSources:
         image_results = []
 
         # Filter out images that are disabled or wip at the konflux level
-        changing_image_names = list(
+        changing_image_names = set(
             filter(lambda image_name: self.is_image_enabled(image_name), self.changing_image_names)
         )
         for image_meta in self.all_image_metas:
@@ -1600,23 +1884,25 @@ class ConfigScanSources:
             results['issues'] = self.issues
             click.echo(yaml.safe_dump(results, indent=4))
         else:
+            # Build the whole report first and write it out at once
+            lines = []
             # Log change results
             for kind, items in results.items():
                 if not items:
                     continue
-                click.echo(kind.upper() + ":")
+                lines.append(kind.upper() + ":")
                 for item in items:
                     code_str = f" [code: {item['code']}]" if item.get('code') else ''
-                    click.echo(
+                    lines.append(
                         '  {} is {} (reason: {})'.format(
                             item['name'], 'changed' if item['changed'] else 'the same', item['reason']
                         )
                         + code_str
                     )
             # Log issues
-            click.echo("ISSUES:")
-            for item in self.issues:
-                click.echo(f"   {item['name']}: {item['issue']}")
+            lines.append("ISSUES:")
+            lines.extend(f"   {item['name']}: {item['issue']}" for item in self.issues)
+            click.echo('\n'.join(lines))
 
 
 @cli.command("beta:config:konflux:scan-sources", short_help="Determine if any rpms / images need to be rebuilt.")
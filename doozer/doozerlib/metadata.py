@@ -4,7 +4,9 @@ import io
 import pathlib
 import re
 import sys
+import threading
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Dict, List, NamedTuple, Optional, Tuple, cast
 
@@ -92,6 +94,9 @@ class Metadata(MetadataBase):
 
         self.commitish = commitish
 
+        # Targets are checked for rebuilds from several threads, which all share the same distgit repo
+        self._distgit_repo_lock = threading.Lock()
+
         # For efficiency, we want to prevent some verbs from introducing changes that
         # trigger distgit or upstream cloning. Setting this flag to True will cause
         # an exception if it is attempted.
@@ -168,8 +173,9 @@ class Metadata(MetadataBase):
         return f'ssh://{pkgs_host}/{self.qualified_name}'
 
     def distgit_repo(self, autoclone=True) -> DistGitRepo:
-        if self._distgit_repo is None:
-            self._distgit_repo = DISTGIT_TYPES[self.meta_type](self, autoclone=autoclone)
+        with self._distgit_repo_lock:
+            if self._distgit_repo is None:
+                self._distgit_repo = DISTGIT_TYPES[self.meta_type](self, autoclone=autoclone)
         return self._distgit_repo
 
     def build_root_tag(self):
@@ -330,9 +336,14 @@ class Metadata(MetadataBase):
 
     def needs_rebuild(self):
         if self.config.targets:
-            # If this meta has multiple build targets, check currency of each
-            for target in self.config.targets:
-                hint = self._target_needs_rebuild(el_target=target)
+            # If this meta has multiple build targets, check currency of each.
+            # All targets are checked at once, so this takes as long as the slowest target;
+            # hints are still considered in target order, so the result is the same as checking them one by one
+            with ThreadPoolExecutor(max_workers=len(self.config.targets)) as executor:
+                hints = list(
+                    executor.map(lambda target: self._target_needs_rebuild(el_target=target), self.config.targets)
+                )
+            for hint in hints:
                 if hint.rebuild or hint.code == RebuildHintCode.DELAYING_NEXT_ATTEMPT:
                     # No need to look for more
                     return hint
@@ -365,7 +376,7 @@ class Metadata(MetadataBase):
                 f'and target {el_target}',
             )
 
-        latest_build_creation = dateutil.parser.parse(latest_build['creation_time'])
+        latest_build_creation = datetime.datetime.fromisoformat(latest_build['creation_time'])
         latest_build_creation = latest_build_creation.replace(
             tzinfo=datetime.timezone.utc
         )  # If time lacks timezone info, interpret as UTC
@@ -413,7 +424,7 @@ class Metadata(MetadataBase):
                     reason='Distgit only commit is newer than last successful build',
                 )
 
-            last_failed_build_creation = dateutil.parser.parse(last_failed_build['creation_time'])
+            last_failed_build_creation = datetime.datetime.fromisoformat(last_failed_build['creation_time'])
             last_failed_build_creation = last_failed_build_creation.replace(
                 tzinfo=datetime.timezone.utc
             )  # If time lacks timezone info, interpret as UTC
@@ -478,7 +489,7 @@ class Metadata(MetadataBase):
 
             # Otherwise, there was a failed attempt at this upstream commit on record.
             # Make sure provide at least rebuild_interval hours between such attempts
-            last_attempt_time = dateutil.parser.parse(failed_commit_build['creation_time'])
+            last_attempt_time = datetime.datetime.fromisoformat(failed_commit_build['creation_time'])
             last_attempt_time = last_attempt_time.replace(
                 tzinfo=datetime.timezone.utc
             )  # If time lacks timezone info, interpret as UTC
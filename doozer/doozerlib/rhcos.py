@@ -13,7 +13,7 @@ from artcommonlib.constants import COREOS_RHEL10_STREAMS, RHCOS_RELEASES_BASE_UR
 from artcommonlib.model import Missing, Model
 from artcommonlib.release_util import isolate_el_version_in_release
 from artcommonlib.rhcos import get_build_id_from_rhcos_pullspec
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import RetryCallState, retry, stop_after_attempt, wait_fixed, wait_random_exponential
 
 from doozerlib import brew
 from doozerlib.repodata import OutdatedRPMFinder
@@ -238,6 +238,54 @@ class RHCOSBuildFinder:
             )
 
 
+def _retry_unless_ci_cluster_down(retry_state: RetryCallState) -> bool:
+    """
+    Retry a failed istag lookup, unless another lookup has already given up on the CI cluster
+    """
+
+    return retry_state.outcome.failed and retry_state.args[0].ci_cluster_error is None
+
+
+class CIClusterIstagLookup:
+    """
+    Looks up imagestream tags on the CI cluster.
+    Once a lookup has exhausted its retries, lookups still running or retrying
+    fail on their next attempt rather than waiting on a cluster that is not answering.
+    """
+
+    def __init__(self, ci_kubeconfig: str):
+        self.ci_kubeconfig = ci_kubeconfig
+        self.ci_cluster_error: Optional[ChildProcessError] = None  # first failed lookup, if any
+
+    async def get_istag(self, namespace: str, istag: str) -> str:
+        """
+        Return the JSON definition of an imagestream tag on the CI cluster
+        """
+
+        try:
+            return await self._oc_get_istag(namespace, istag)
+        except ChildProcessError as e:
+            if not self.ci_cluster_error:
+                self.ci_cluster_error = e
+            raise
+
+    @retry(
+        reraise=True,
+        stop=stop_after_attempt(3),
+        wait=wait_random_exponential(multiplier=2, max=10),
+        retry=_retry_unless_ci_cluster_down,
+    )
+    async def _oc_get_istag(self, namespace: str, istag: str) -> str:
+        if self.ci_cluster_error:
+            raise ChildProcessError(f'Not looking up istag {istag}: CI cluster lookups are failing') from (
+                self.ci_cluster_error
+            )
+        _, stdout, _ = await exectools.cmd_gather_async(
+            f"oc --kubeconfig '{self.ci_kubeconfig}' --namespace '{namespace}' get istag '{istag}' -o json"
+        )
+        return stdout.strip()
+
+
 class RHCOSBuildInspector:
     def __init__(
         self, runtime: Runtime, pullspec_for_tag: Dict[str, str], brew_arch: str, build_id: Optional[str] = None
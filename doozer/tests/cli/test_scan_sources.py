@@ -1,15 +1,19 @@
+import asyncio
+from datetime import datetime, timezone
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from artcommonlib.model import Model
 from doozerlib import rhcos
 from doozerlib.cli.scan_sources import ConfigScanSources
+from doozerlib.metadata import RebuildHint, RebuildHintCode
 
 
 class TestScanSourcesCli(IsolatedAsyncioTestCase):
-    @patch("artcommonlib.exectools.cmd_assert")
-    def test_tagged_rhcos_id(self, mock_cmd):
+    @patch("artcommonlib.exectools.cmd_gather_async")
+    async def test_tagged_rhcos_id(self, mock_cmd):
         mock_cmd.return_value = (
+            0,
             '{"image": {"dockerImageMetadata": {"Config": {"Labels": {"org.opencontainers.image.version": "id-1"}}}}}',
             "stderr",
         )
@@ -17,7 +21,7 @@ class TestScanSourcesCli(IsolatedAsyncioTestCase):
         runtime = MagicMock(rpm_map=[], build_system='brew')
         cli = ConfigScanSources(runtime, "kc.conf", False)
 
-        self.assertEqual("id-1", cli._tagged_rhcos_id("cname", "4.2", "s390x", True))
+        self.assertEqual("id-1", await cli._tagged_rhcos_id("cname", "ocp", "4.2-art-latest", "s390x", True))
         self.assertIn("--kubeconfig 'kc.conf'", mock_cmd.call_args_list[0][0][0])
         self.assertIn("--namespace 'ocp-s390x-priv'", mock_cmd.call_args_list[0][0][0])
         self.assertIn("istag '4.2-art-latest-s390x-priv", mock_cmd.call_args_list[0][0][0])
@@ -56,3 +60,146 @@ class TestScanSourcesCli(IsolatedAsyncioTestCase):
 
         mock_get_build.side_effect = rhcos.RHCOSNotFound("test")
         cli._latest_rhcos_build_id("4.9", "aarch64", False)
+
+    @patch("doozerlib.cli.scan_sources.subprocess.Popen")
+    def test_get_last_commit_subjects(self, mock_popen):
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.stdout = iter(
+            [
+                "\0Bump foo\n",
+                "\n",
+                "images/foo.yml\n",
+                "\0Merge pull request #1\n",
+                "\0\n",
+                "\n",
+                "images/baz.yml\n",
+                "images/foo.yml\n",
+                "\0Older change to bar\n",
+                "\n",
+                "images/bar.yml\n",
+                "\0Oldest change to bar\n",
+            ]
+        )
+        cli = ConfigScanSources(MagicMock(data_dir="/data"), "dummy", False)
+
+        self.assertEqual(
+            cli._get_last_commit_subjects(['images/foo.yml', 'images/bar.yml', 'images/baz.yml']),
+            {'images/foo.yml': 'Bump foo', 'images/baz.yml': '', 'images/bar.yml': 'Older change to bar'},
+        )
+        # Only the requested paths are logged, and git stops once each of them has been seen
+        cmd = mock_popen.call_args[0][0]
+        self.assertEqual(sorted(cmd[cmd.index('--') + 1 :]), ['images/bar.yml', 'images/baz.yml', 'images/foo.yml'])
+        self.assertEqual(mock_popen.call_args[1]['cwd'], "/data")
+        proc.terminate.assert_called_once()
+        self.assertEqual(list(proc.stdout), ["\0Oldest change to bar\n"])
+
+    @patch("doozerlib.cli.scan_sources.subprocess.Popen")
+    def test_get_last_commit_subjects_failure(self, mock_popen):
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.stdout = iter([])
+        mock_popen.return_value.returncode = 128
+        cli = ConfigScanSources(MagicMock(data_dir="/data"), "dummy", False)
+        with self.assertRaises(IOError):
+            cli._get_last_commit_subjects(['images/foo.yml'])
+
+    def test_check_config_commits(self):
+        foo = MagicMock(distgit_key='foo', config_filename='foo.yml')
+        bar = MagicMock(distgit_key='bar', config_filename='bar.yml')
+        cli = ConfigScanSources(MagicMock(), "dummy", False)
+        cli.add_image_meta_change = MagicMock()
+        cli._get_last_commit_subjects = MagicMock(
+            return_value={'images/foo.yml': 'Bump foo', 'images/bar.yml': 'Tweak bar [scan-sources:noop]'}
+        )
+
+        cli.check_config_commits([foo, bar])
+        cli._get_last_commit_subjects.assert_called_once_with(['images/foo.yml', 'images/bar.yml'])
+        cli.add_image_meta_change.assert_called_once()
+        self.assertIs(cli.add_image_meta_change.call_args[0][0], foo)
+        self.assertEqual(cli.add_image_meta_change.call_args[0][1].code, RebuildHintCode.CONFIG_CHANGE)
+
+        # Nothing to look up without config changes
+        cli._get_last_commit_subjects.reset_mock()
+        cli.check_config_commits([])
+        cli._get_last_commit_subjects.assert_not_called()
+
+    def test_find_oldest_newest(self):
+        koji_api = MagicMock()
+        multicall = koji_api.multicall.return_value.__enter__.return_value
+        multicall.getEvent.side_effect = lambda event_id: MagicMock(result={'ts': event_id * 10.0})
+        cli = ConfigScanSources(MagicMock(), "dummy", False)
+
+        cli.find_oldest_newest(koji_api, [{'creation_event_id': 3}, {'creation_event_id': 1}, {'creation_event_id': 2}])
+        koji_api.multicall.assert_called_once_with(strict=True)
+        self.assertEqual(cli.oldest_image_event_ts, 10.0)
+        self.assertEqual(cli.newest_image_event_ts, 30.0)
+
+        # Previously found bounds are only widened
+        cli.find_oldest_newest(koji_api, [{'creation_event_id': 2}, {'creation_event_id': 4}])
+        self.assertEqual(cli.oldest_image_event_ts, 10.0)
+        self.assertEqual(cli.newest_image_event_ts, 40.0)
+
+        # Nothing to query without builds
+        koji_api.multicall.reset_mock()
+        cli.find_oldest_newest(koji_api, [])
+        koji_api.multicall.assert_not_called()
+
+    def test_check_dependents(self):
+        def _image_meta(distgit_key, parent=None, builders=(), dependencies=()):
+            return MagicMock(
+                distgit_key=distgit_key,
+                dependencies=set(dependencies),
+                config=Model({'from': {'member': parent, 'builder': [{'member': builder} for builder in builders]}}),
+            )
+
+        parent = _image_meta('parent')
+        builder = _image_meta('builder')
+        child = _image_meta('child', parent='parent', builders=['builder'], dependencies=['excluded'])
+        image_map = {'parent': parent, 'builder': builder, 'child': child}
+
+        cli = ConfigScanSources(MagicMock(), "dummy", False)
+        cli.add_image_meta_change = MagicMock()
+
+        # The parent was rebuilt after the child: the child needs a rebuild
+        rebase_times = {
+            'parent': datetime(2025, 1, 2, tzinfo=timezone.utc),
+            'builder': datetime(2024, 12, 1, tzinfo=timezone.utc),
+            'child': datetime(2025, 1, 1, tzinfo=timezone.utc),
+        }
+        cli.check_dependents(child, rebase_times, image_map)
+        cli.add_image_meta_change.assert_called_once()
+        self.assertEqual(cli.add_image_meta_change.call_args[0][0], child)
+        self.assertEqual(cli.add_image_meta_change.call_args[0][1].code, RebuildHintCode.DEPENDENCY_NEWER)
+
+        # All dependencies are older than the child: nothing to do
+        cli.add_image_meta_change.reset_mock()
+        rebase_times['parent'] = datetime(2024, 12, 31, tzinfo=timezone.utc)
+        cli.check_dependents(child, rebase_times, image_map)
+        cli.add_image_meta_change.assert_not_called()
+
+        # Without a rebase time for the child, there is nothing to compare with
+        rebase_times['builder'] = datetime(2025, 2, 1, tzinfo=timezone.utc)
+        del rebase_times['child']
+        cli.check_dependents(child, rebase_times, image_map)
+        cli.add_image_meta_change.assert_not_called()
+
+    async def test_check_changing_rpms_order(self):
+        second_done = asyncio.Event()
+
+        async def _first_need_change(**_):
+            # The first image is only done checking after the second one
+            await second_done.wait()
+            return first, RebuildHint(RebuildHintCode.PACKAGE_CHANGE, 'first')
+
+        async def _second_need_change(**_):
+            second_done.set()
+            return second, RebuildHint(RebuildHintCode.PACKAGE_CHANGE, 'second')
+
+        first = MagicMock(distgit_key='first', does_image_need_change=_first_need_change)
+        second = MagicMock(distgit_key='second', does_image_need_change=_second_need_change)
+        cli = ConfigScanSources(MagicMock(), "dummy", False)
+        cli._image_metas = (first, second)
+        cli.add_image_meta_change = MagicMock()
+
+        await cli.check_changing_rpms()
+        # Changes are applied in image order, not in completion order
+        self.assertEqual([c[0][0] for c in cli.add_image_meta_change.call_args_list], [first, second])
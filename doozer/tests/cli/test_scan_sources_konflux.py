@@ -1,13 +1,14 @@
+import asyncio
 import base64
 import json
 from datetime import datetime, timezone
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock, patch
 
 import aiohttp
 import yaml
 from artcommonlib.konflux.konflux_build_record import KonfluxBuildRecord
-from artcommonlib.model import Missing
+from artcommonlib.model import Missing, Model
 from doozerlib.cli.scan_sources_konflux import ConfigScanSources
 from doozerlib.constants import KONFLUX_DEFAULT_IMAGE_BUILD_PLR_TEMPLATE_URL
 from doozerlib.image import ImageMetadata
@@ -694,3 +695,295 @@ class TestTaskBundleIntegration(TestScanSourcesKonflux):
 
         result = meta.get_konflux_network_mode()
         self.assertEqual(result, "internal-only")
+
+
+class TestRebaseIntoPriv(TestScanSourcesKonflux):
+    """Test the openshift-priv rebase helpers."""
+
+    @patch.object(ConfigScanSources, '_ls_remote')
+    @patch.object(ConfigScanSources, '_github_branch_sha')
+    async def test_prefetch_remote_shas_github(self, mock_github_sha, mock_ls_remote):
+        """Test that GitHub refs are resolved through the GitHub API."""
+        mock_github_sha.side_effect = lambda url, ref: f'{ref}-sha'
+
+        await self.scanner._prefetch_remote_shas(
+            [
+                ('https://github.com/openshift/foo', 'main'),
+                ('git@github.com:openshift-priv/foo.git', 'main'),
+            ]
+        )
+
+        self.assertEqual(mock_github_sha.call_count, 2)
+        mock_ls_remote.assert_not_called()
+        self.assertEqual(
+            self.scanner._sha_cache,
+            {
+                ('https://github.com/openshift/foo', 'main'): 'main-sha',
+                ('git@github.com:openshift-priv/foo.git', 'main'): 'main-sha',
+            },
+        )
+
+    @patch.object(ConfigScanSources, '_ls_remote')
+    @patch.object(ConfigScanSources, '_ls_remote_http')
+    @patch.object(ConfigScanSources, '_github_branch_sha')
+    async def test_prefetch_remote_shas_http(self, mock_github_sha, mock_ls_remote_http, mock_ls_remote):
+        """Test that unresolved refs are listed over smart HTTP once per remote."""
+        mock_github_sha.return_value = None
+        mock_ls_remote_http.return_value = 'aaa\trefs/heads/main\nbbb\trefs/heads/release-4.20'
+
+        await self.scanner._prefetch_remote_shas(
+            [
+                ('https://github.com/openshift/foo', 'main'),
+                ('https://github.com/openshift/foo', 'release-4.20'),
+            ]
+        )
+
+        mock_ls_remote_http.assert_called_once_with('https://github.com/openshift/foo')
+        mock_ls_remote.assert_not_called()
+        self.assertEqual(
+            self.scanner._sha_cache,
+            {
+                ('https://github.com/openshift/foo', 'main'): 'aaa',
+                ('https://github.com/openshift/foo', 'release-4.20'): 'bbb',
+            },
+        )
+
+    @patch.object(ConfigScanSources, '_ls_remote')
+    @patch.object(ConfigScanSources, '_ls_remote_http', return_value=None)
+    @patch.object(ConfigScanSources, '_github_branch_sha')
+    async def test_prefetch_remote_shas_ls_remote(self, mock_github_sha, _, mock_ls_remote):
+        """Test that refs unavailable over HTTP are fetched with one ls-remote call per remote."""
+        mock_github_sha.return_value = None
+        outputs = {
+            'https://github.com/openshift/foo': 'aaa\trefs/heads/main\nbbb\trefs/heads/release-4.20\n',
+            'https://gitlab.com/openshift-priv/foo': 'ccc\trefs/heads/release-4.20\n',
+        }
+        mock_ls_remote.side_effect = lambda url, refs: outputs[url]
+
+        await self.scanner._prefetch_remote_shas(
+            [
+                ('https://github.com/openshift/foo', 'main'),
+                ('https://github.com/openshift/foo', 'release-4.20'),
+                ('https://gitlab.com/openshift-priv/foo', 'release-4.20'),
+            ]
+        )
+
+        self.assertEqual(mock_github_sha.call_count, 2)
+        self.assertEqual(mock_ls_remote.call_count, 2)
+        mock_ls_remote.assert_any_call('https://github.com/openshift/foo', ['main', 'release-4.20'])
+        self.assertEqual(
+            self.scanner._sha_cache,
+            {
+                ('https://github.com/openshift/foo', 'main'): 'aaa',
+                ('https://github.com/openshift/foo', 'release-4.20'): 'bbb',
+                ('https://gitlab.com/openshift-priv/foo', 'release-4.20'): 'ccc',
+            },
+        )
+
+    @patch.object(ConfigScanSources, '_ls_remote')
+    @patch.object(ConfigScanSources, '_ls_remote_http', return_value=None)
+    @patch.object(ConfigScanSources, '_github_branch_sha')
+    async def test_prefetch_remote_shas_failure(self, mock_github_sha, _, mock_ls_remote):
+        """Test that a failing remote leaves no SHAs behind, and is treated as matching."""
+        mock_github_sha.return_value = None
+        mock_ls_remote.side_effect = ChildProcessError('failed')
+
+        await self.scanner._prefetch_remote_shas([('https://github.com/openshift/foo', 'main')])
+
+        self.assertEqual(self.scanner._sha_cache, {})
+        self.assertTrue(self.scanner._do_shas_match('https://github.com/openshift/foo', 'main', 'priv_url', 'main'))
+
+    def test_parse_ref_advertisement(self):
+        """Test decoding of a smart HTTP ref advertisement."""
+        data = (
+            b'001e# service=git-upload-pack\n'
+            b'0000'
+            b'005c' + b'a' * 40 + b' HEAD\0multi_ack thin-pack side-band agent=git/2\n'
+            b'003d' + b'b' * 40 + b' refs/heads/main\n'
+            b'0000'
+        )
+
+        self.assertEqual(
+            ConfigScanSources._parse_ref_advertisement(data),
+            f'{"a" * 40}\tHEAD\n{"b" * 40}\trefs/heads/main',
+        )
+
+    @patch.object(ConfigScanSources, '_is_pub_ancestor_of_priv')
+    @patch.object(ConfigScanSources, '_github_compare_status')
+    async def test_reconcile_with_public_upstream_compare(self, mock_compare, mock_is_ancestor):
+        """Test that GitHub compare API avoids cloning repos where private upstream is already ahead."""
+        self.runtime.source_resolver = MagicMock()
+        meta = MagicMock()
+        meta.config = Model(
+            {
+                'content': {
+                    'source': {'git': {'url': 'git@github.com:openshift-priv/foo.git', 'branch': {'target': 'main'}}}
+                }
+            }
+        )
+        self.scanner._sha_cache = {
+            ('https://github.com/openshift/foo', 'main'): 'aaa',
+            ('git@github.com:openshift-priv/foo.git', 'main'): 'bbb',
+        }
+
+        mock_compare.return_value = 'ahead'
+        await self.scanner._reconcile_with_public_upstream(
+            meta, 'https://github.com/openshift/foo', 'main', 'main', 'foo'
+        )
+        mock_compare.assert_awaited_once_with('git@github.com:openshift-priv/foo.git', 'aaa', 'bbb')
+        self.runtime.source_resolver.resolve_source.assert_not_called()
+
+        # Comparison not available: fall back to cloning and checking ancestry locally
+        mock_compare.return_value = None
+        mock_is_ancestor.return_value = True
+        await self.scanner._reconcile_with_public_upstream(
+            meta, 'https://github.com/openshift/foo', 'main', 'main', 'foo'
+        )
+        self.runtime.source_resolver.resolve_source.assert_called_once_with(meta)
+        mock_is_ancestor.assert_called_once()
+
+    def _rebase_candidate(self, name, priv_branch):
+        meta = MagicMock(meta_type='rpm', enabled=True)
+        meta.name = name
+        meta.config = Model(
+            {
+                'content': {
+                    'source': {
+                        'git': {'url': f'git@github.com:openshift-priv/{name}.git', 'branch': {'target': priv_branch}}
+                    }
+                }
+            }
+        )
+        return meta
+
+    @patch.object(ConfigScanSources, '_reconcile_with_public_upstream')
+    @patch.object(ConfigScanSources, '_prefetch_remote_shas', new_callable=AsyncMock)
+    @patch('doozerlib.cli.scan_sources_konflux.SourceResolver.get_public_upstream')
+    async def test_rebase_into_priv_serializes_priv_branches(self, mock_public_upstream, _, mock_reconcile):
+        """Test that components sharing a private branch are reconciled one at a time, other branches concurrently."""
+        mock_public_upstream.side_effect = lambda url, _: (url.replace('openshift-priv', 'openshift'), None, True)
+        # Two components are built from foo's main branch
+        self.scanner.all_metas = [
+            self._rebase_candidate('foo', 'main'),
+            self._rebase_candidate('foo', 'main'),
+            self._rebase_candidate('foo', 'release-4.20'),
+            self._rebase_candidate('bar', 'main'),
+        ]
+
+        running = []
+        max_running = {}
+        # Reconciliations only complete once all three branches are in flight together.
+        # This is driven by an event, as asyncio.sleep may be stubbed out by other tests and not yield
+        all_branches_running = asyncio.Event()
+
+        async def reconcile(metadata, *_):
+            branch = (metadata.name, metadata.config.content.source.git.branch.target)
+            running.append(branch)
+            max_running[branch] = max(max_running.get(branch, 0), running.count(branch))
+            if len(set(running)) == 3:
+                all_branches_running.set()
+            await asyncio.wait_for(all_branches_running.wait(), timeout=5)
+            running.remove(branch)
+
+        mock_reconcile.side_effect = reconcile
+
+        await self.scanner.rebase_into_priv()
+
+        self.assertEqual(mock_reconcile.await_count, 4)
+        self.assertEqual(max_running[('foo', 'main')], 1)
+        self.assertTrue(all_branches_running.is_set())
+
+    @patch.object(ConfigScanSources, '_reconcile_with_public_upstream')
+    @patch.object(ConfigScanSources, '_prefetch_remote_shas', new_callable=AsyncMock)
+    @patch('doozerlib.cli.scan_sources_konflux.SourceResolver.get_public_upstream')
+    async def test_rebase_into_priv_failure_waits_for_other_branches(self, mock_public_upstream, _, mock_reconcile):
+        """Test that a failing branch does not abandon reconciliations still running on other branches."""
+        mock_public_upstream.side_effect = lambda url, _: (url.replace('openshift-priv', 'openshift'), None, True)
+        self.scanner.all_metas = [self._rebase_candidate('foo', 'main'), self._rebase_candidate('bar', 'main')]
+        finished = []
+        # Driven by an event on a timer, as asyncio.sleep may be stubbed out by other tests and not yield
+        bar_can_finish = asyncio.Event()
+
+        async def reconcile(metadata, *_):
+            if metadata.name == 'foo':
+                # bar is still being reconciled when foo fails
+                asyncio.get_running_loop().call_later(0.05, bar_can_finish.set)
+                raise IOError('Failed checking ancestry')
+            await asyncio.wait_for(bar_can_finish.wait(), timeout=5)
+            finished.append(metadata.name)
+
+        mock_reconcile.side_effect = reconcile
+
+        with self.assertRaises(IOError):
+            await self.scanner.rebase_into_priv()
+        self.assertEqual(finished, ['bar'])
+
+    def test_has_sha_branch(self):
+        """Test detection of components pinned to a commit hash."""
+
+        def _meta(target):
+            meta = MagicMock()
+            meta.config = Model({'content': {'source': {'git': {'branch': {'target': target}}}}})
+            return meta
+
+        self.assertTrue(ConfigScanSources._has_sha_branch(_meta('0a1b2c3d4e5f')))
+        self.assertFalse(ConfigScanSources._has_sha_branch(_meta('release-4.20')))
+        self.assertFalse(ConfigScanSources._has_sha_branch(_meta(None)))
+
+    def test_do_shas_match(self):
+        """Test SHA comparison against the prefetched values."""
+        self.scanner._sha_cache = {
+            ('pub_url', 'main'): 'aaa',
+            ('priv_url', 'main'): 'aaa',
+            ('priv_url', 'other'): 'bbb',
+        }
+
+        self.assertTrue(self.scanner._do_shas_match('pub_url', 'main', 'priv_url', 'main'))
+        self.assertFalse(self.scanner._do_shas_match('pub_url', 'main', 'priv_url', 'other'))
+
+
+class TestFindUpstreamCommitHash(TestScanSourcesKonflux):
+    """Test the find_upstream_commit_hash method."""
+
+    @patch('doozerlib.cli.scan_sources_konflux.SourceResolver.detect_remote_source_branch')
+    def test_find_upstream_commit_hash_cached(self, mock_detect):
+        """Test that components sharing a repository and branch resolve it only once."""
+        mock_detect.return_value = ('main', 'abc123')
+        self.runtime.stage = False
+        self.runtime.group_config = Model({})
+        source = {
+            'content': {'source': {'git': {'url': 'git@github.com:openshift/foo.git', 'branch': {'target': 'main'}}}}
+        }
+        meta1 = MagicMock(config=Model(source))
+        meta2 = MagicMock(config=Model(source))
+
+        self.assertEqual(self.scanner.find_upstream_commit_hash(meta1), 'abc123')
+        self.assertEqual(self.scanner.find_upstream_commit_hash(meta2), 'abc123')
+        mock_detect.assert_called_once()
+
+
+class TestGetDescendants(TestScanSourcesKonflux):
+    """Test the _get_descendants method."""
+
+    def test_get_descendants_memoized(self):
+        """Test that descendants are computed once per image and include the whole subtree."""
+
+        children_reads = []
+
+        def _image_meta(distgit_key, children):
+            meta = MagicMock(distgit_key=distgit_key)
+            children_reads.append(PropertyMock(return_value=children))
+            type(meta).children = children_reads[-1]
+            return meta
+
+        grandchild = _image_meta('grandchild', [])
+        child = _image_meta('child', [grandchild])
+        parent = _image_meta('parent', [child])
+
+        self.assertEqual(self.scanner._get_descendants(parent), {child, grandchild})
+        self.assertEqual(self.scanner._get_descendants(child), {grandchild})
+        self.assertEqual(self.scanner._get_descendants(parent), {child, grandchild})
+
+        # Each image of the tree was walked only once
+        for children in children_reads:
+            children.assert_called_once_with()
@@ -1,12 +1,14 @@
 import datetime
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from unittest.mock import MagicMock, Mock, patch
 
 from artcommonlib.brew import BuildStates
 from artcommonlib.model import Model
 from doozerlib.image import ImageMetadata
-from doozerlib.metadata import CgitAtomFeedEntry, Metadata, RebuildHintCode
+from doozerlib.metadata import CgitAtomFeedEntry, Metadata, RebuildHint, RebuildHintCode
 
 
 class TestMetadata(TestCase):
@@ -457,6 +459,44 @@ class TestMetadata(TestCase):
         ]
         self.assertEqual(meta.needs_rebuild().code, RebuildHintCode.DELAYING_NEXT_ATTEMPT)
 
+    def test_needs_rebuild_multi_target_order(self):
+        meta = self.meta
+        meta.config.targets = ['el7', 'el8', 'el9']
+        el7_done = threading.Event()
+
+        def target_needs_rebuild(el_target=None):
+            if el_target == 'el7':
+                el7_done.wait(timeout=5)
+                return RebuildHint(RebuildHintCode.NEW_UPSTREAM_COMMIT, 'el7')
+            if el_target == 'el8':
+                # el8 completes before el7, but el7 comes first in target order
+                el7_done.set()
+                return RebuildHint(RebuildHintCode.DELAYING_NEXT_ATTEMPT, 'el8')
+            return RebuildHint(RebuildHintCode.BUILD_IS_UP_TO_DATE, 'el9')
+
+        meta._target_needs_rebuild = Mock(side_effect=target_needs_rebuild)
+        self.assertEqual(meta.needs_rebuild().reason, 'el7')
+        self.assertEqual(meta._target_needs_rebuild.call_count, 3)
+
+        # If no target needs a rebuild, the hint of the last target is returned
+        meta._target_needs_rebuild = Mock(return_value=RebuildHint(RebuildHintCode.BUILD_IS_UP_TO_DATE, ''))
+        self.assertEqual(meta.needs_rebuild().code, RebuildHintCode.BUILD_IS_UP_TO_DATE)
+
+    def test_distgit_repo_created_once(self):
+        distgit_type = Mock()
+        barrier = threading.Barrier(4)
+
+        def get_distgit_repo(_):
+            barrier.wait(timeout=5)
+            return self.meta.distgit_repo(autoclone=False)
+
+        with patch.dict("doozerlib.metadata.DISTGIT_TYPES", {'image': distgit_type}):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                repos = list(executor.map(get_distgit_repo, range(4)))
+
+        distgit_type.assert_called_once_with(self.meta, autoclone=False)
+        self.assertTrue(all(repo is repos[0] for repo in repos))
+
     @patch(
         "doozerlib.metadata.exectools.cmd_assert", return_value=("296ac244f3e7fd2d937316639892f90f158718b0", "")
     )  # emulate response to ls-remote of openshift/release
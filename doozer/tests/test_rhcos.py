@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -12,6 +13,7 @@ from artcommonlib.rhcos import RhcosMissingContainerException
 from doozerlib import rhcos
 from doozerlib.repodata import Repodata, Rpm
 from doozerlib.repos import Repos
+from tenacity import wait_none
 
 
 class MockRuntime(object):
@@ -330,3 +332,37 @@ class TestRhcos(unittest.IsolatedAsyncioTestCase):
         get_repodata_threadsafe.assert_awaited()
         get_os_metadata_rpm_list.assert_called_once_with(False)
         self.assertEqual(actual, [('bar-0:1.0.0-1.el9.x86_64', 'bar-0:1.1.0-1.el9.x86_64', 'rhel-8-appstream-rpms')])
+
+    @patch.object(rhcos.CIClusterIstagLookup._oc_get_istag.retry, "wait", wait_none())
+    @patch("artcommonlib.exectools.cmd_gather_async")
+    async def test_ci_cluster_istag_lookup_fails_fast(self, mock_cmd):
+        # The interleaving is driven by events only: retry sleeps may not yield to the event loop
+        private_lookup_started = asyncio.Event()
+        public_lookup_done = asyncio.Event()
+
+        async def oc(cmd):
+            if "'ocp-priv'" in cmd:
+                # The private lookup is still waiting on the cluster while the public one gives up
+                private_lookup_started.set()
+                await public_lookup_done.wait()
+            else:
+                await private_lookup_started.wait()
+            raise ChildProcessError("cluster unreachable")
+
+        async def public_lookup():
+            try:
+                return await lookup.get_istag("ocp", "4.2-art-latest:cname")
+            finally:
+                public_lookup_done.set()
+
+        mock_cmd.side_effect = oc
+        lookup = rhcos.CIClusterIstagLookup("kc.conf")
+
+        results = await asyncio.gather(
+            public_lookup(), lookup.get_istag("ocp-priv", "4.2-art-latest-priv:cname"), return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(result, ChildProcessError) for result in results))
+        commands = [call.args[0] for call in mock_cmd.call_args_list]
+        self.assertEqual(3, sum("'ocp'" in command for command in commands))
+        # Once the public lookup exhausted its retries, the concurrent private lookup does not try again
+        self.assertEqual(1, sum("'ocp-priv'" in command for command in commands))
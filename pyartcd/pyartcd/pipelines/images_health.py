@@ -1,5 +1,6 @@
 import asyncio
 import json
+import os
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from urllib.parse import quote
@@ -38,19 +39,27 @@ class ImagesHealthPipeline:
         self.image_list = image_list.split(',') if image_list else []
         self.assembly = assembly
         self.report = []
-        self.slack_client = self.runtime.new_slack_client()
         self.scanned_versions = []
 
+        # Check the Slack token before scanning; each notification creates its own client from it
+        self.slack_token = None
+        if not self.runtime.dry_run:
+            self.slack_token = os.environ.get('SLACK_BOT_TOKEN')
+            if not self.slack_token:
+                raise ValueError('SLACK_BOT_TOKEN environment variable is not set')
+
     async def run(self):
         await asyncio.gather(*(self.get_report(v) for v in self.versions))
         self.runtime.logger.info('Found %s concerns', len(self.report))
 
+        notifications = []
         if self.send_to_release_channel:
-            for version in self.scanned_versions:
-                await self.notify_release_channel(version)
-
+            notifications.extend(self.notify_release_channel(version) for version in self.scanned_versions)
         if self.send_to_forum_ocp_art:
-            await self.notify_forum_ocp_art()
+            notifications.append(self.notify_forum_ocp_art())
+
+        # Each notification goes to a different channel through its own Slack client: send them concurrently
+        await asyncio.gather(*notifications)
 
     async def get_report(self, version: str) -> Optional[list]:
         doozer_working = f'{self.doozer_working}-{version}'
@@ -89,7 +98,8 @@ class ImagesHealthPipeline:
         self.report.extend(report)
 
     async def notify_release_channel(self, version):
-        self.slack_client.bind_channel(version)
+        slack_client = self.runtime.new_slack_client(self.slack_token)
+        slack_client.bind_channel(version)
 
         concerns = [
             concern
@@ -103,19 +113,20 @@ class ImagesHealthPipeline:
             version_tag += f' (assembly `{self.assembly}`)'
 
         if not concerns:
-            await self.slack_client.say(f':white_check_mark: All images are healthy for {version_tag}')
+            await slack_client.say(f':white_check_mark: All images are healthy for {version_tag}')
             return
 
-        response = await self.slack_client.say(
+        response = await slack_client.say(
             f':alert: There are some issues to look into for {version_tag}. {self.get_component_tag(concerns)}'
         )
         report = ''
         for concern in concerns:
             report += f'{self.get_message_for_release(concern)}\n'
-        await self.slack_client.say(report, thread_ts=response['ts'])
+        await slack_client.say(report, thread_ts=response['ts'])
 
     async def notify_forum_ocp_art(self):
-        self.slack_client.bind_channel('#forum-ocp-art')
+        slack_client = self.runtime.new_slack_client(self.slack_token)
+        slack_client.bind_channel('#forum-ocp-art')
 
         image_concerns = {}
         for concern in self.report:
@@ -129,10 +140,10 @@ class ImagesHealthPipeline:
             image_concerns.setdefault(image_name, []).append(concern)
 
         if not image_concerns:
-            await self.slack_client.say(':white_check_mark: All images are healthy for all monitored releases')
+            await slack_client.say(':white_check_mark: All images are healthy for all monitored releases')
             return
 
-        response = await self.slack_client.say(
+        response = await slack_client.say(
             f':alert: There are some issues to look into for Openshift builds:  {self.get_component_tag(image_concerns)}',
             link_build_url=False,
         )
@@ -142,7 +153,7 @@ class ImagesHealthPipeline:
             for concern in concerns:
                 image_message += f'\n• {self.get_message_for_forum(concern)}'
 
-            await self.slack_client.say(image_message, thread_ts=response['ts'], link_build_url=False)
+            await slack_client.say(image_message, thread_ts=response['ts'], link_build_url=False)
 
     def get_message_for_release(self, concern: dict):
         """
@@ -1,5 +1,5 @@
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from doozerlib.cli.images_health import ConcernCode
 from pyartcd.pipelines.images_health import ImagesHealthPipeline
@@ -7,11 +7,13 @@ from pyartcd.pipelines.images_health import ImagesHealthPipeline
 DATA_PATH = "https://github.com/openshift-eng/ocp-build-data"
 
 
+@patch.dict("os.environ", {"SLACK_BOT_TOKEN": "xoxb-token"})
 class TestImagesHealthPipeline(IsolatedAsyncioTestCase):
     def setUp(self):
         self.mock_runtime = MagicMock()
         self.mock_runtime.working_dir = MagicMock()
         self.mock_runtime.logger = MagicMock()
+        self.mock_runtime.dry_run = False
 
         mock_slack_client = MagicMock()
         mock_slack_client.say = AsyncMock()
@@ -156,3 +158,38 @@ class TestImagesHealthPipeline(IsolatedAsyncioTestCase):
         mock_slack_client.say.assert_called_once_with(
             ":white_check_mark: All images are healthy for all monitored releases"
         )
+
+    async def test_run_notifies_each_channel_with_its_own_client(self):
+        pipeline = ImagesHealthPipeline(
+            runtime=self.mock_runtime,
+            versions="4.21,4.22",
+            send_to_release_channel=True,
+            send_to_forum_ocp_art=True,
+            data_path=DATA_PATH,
+            data_gitref="",
+            image_list="",
+            assembly="stream",
+        )
+        pipeline.get_report = AsyncMock()
+        pipeline.scanned_versions = ["4.21", "4.22"]
+        mock_slack_client = self.mock_runtime.new_slack_client.return_value
+        # when
+        await pipeline.run()
+        # then
+        self.assertEqual(self.mock_runtime.new_slack_client.call_count, 3)
+        self.mock_runtime.new_slack_client.assert_called_with("xoxb-token")
+        bound_channels = {call[0][0] for call in mock_slack_client.bind_channel.call_args_list}
+        self.assertEqual(bound_channels, {"4.21", "4.22", "#forum-ocp-art"})
+
+    def test_missing_slack_token_fails_before_scanning(self):
+        with patch.dict("os.environ", clear=True), self.assertRaises(ValueError):
+            ImagesHealthPipeline(
+                runtime=self.mock_runtime,
+                versions="4.22",
+                send_to_release_channel=True,
+                send_to_forum_ocp_art=False,
+                data_path=DATA_PATH,
+                data_gitref="",
+                image_list="",
+                assembly="stream",
+            )